@@ -0,0 +1,165 @@
+"""Compile formula strings into reusable plans built from calculator operations.
+
+A formula such as ``"(a + b) * c / d"`` is parsed once into a plan that calls
+the functions in ``calculator`` directly. The plan is cached, so compiling the
+same formula again is free, and it can be evaluated over many variable
+bindings or whole columns in a single call.
+"""
+
+import ast
+import inspect
+import math
+from functools import lru_cache
+
+from calculator import add, divide, multiply, square, subtract
+
+_OPERATIONS = {
+    "add": add,
+    "subtract": subtract,
+    "multiply": multiply,
+    "divide": divide,
+    "square": square,
+}
+
+_ARITY = {
+    name: len(inspect.signature(operation).parameters)
+    for name, operation in _OPERATIONS.items()
+}
+
+_BINARY_OPERATORS = {
+    ast.Add: "add",
+    ast.Sub: "subtract",
+    ast.Mult: "multiply",
+    ast.Div: "divide",
+}
+
+
+class Expression:
+    """A compiled formula."""
+
+    def __init__(self, formula, variables, function):
+        self.formula = formula
+        self.variables = variables
+        self._function = function
+
+    def __repr__(self):
+        return f"Expression({self.formula!r})"
+
+    def _missing(self, values):
+        """Return a ValueError naming the variables missing from values."""
+        missing = ", ".join(name for name in self.variables if name not in values)
+        return ValueError(f"Missing values for variables: {missing}")
+
+    def evaluate(self, **values):
+        """Evaluate the formula for a single set of variable values."""
+        try:
+            arguments = [values[name] for name in self.variables]
+        except KeyError:
+            raise self._missing(values) from None
+        return self._function(*arguments)
+
+    def evaluate_many(self, bindings):
+        """Evaluate the formula for each mapping of variable values."""
+        function, variables = self._function, self.variables
+        results = []
+        for binding in bindings:
+            try:
+                arguments = [binding[name] for name in variables]
+            except KeyError:
+                raise self._missing(binding) from None
+            results.append(function(*arguments))
+        return results
+
+    def evaluate_columns(self, **columns):
+        """Evaluate the formula row by row over equally sized columns."""
+        if any(name not in columns for name in self.variables):
+            raise self._missing(columns)
+        lengths = {len(columns[name]) for name in self.variables}
+        if len(lengths) > 1:
+            raise ValueError("All columns must have the same length")
+        return list(map(self._function, *[columns[name] for name in self.variables]))
+
+
+class _Translator(ast.NodeVisitor):
+    """Translate a validated formula AST into calls to calculator operations."""
+
+    def __init__(self):
+        self.variables = []
+
+    def generic_visit(self, node):
+        raise ValueError(f"Unsupported syntax in formula: {type(node).__name__}")
+
+    def visit_Expression(self, node):
+        return self.visit(node.body)
+
+    def visit_BinOp(self, node):
+        left, right = self.visit(node.left), self.visit(node.right)
+        if isinstance(node.op, ast.Pow):
+            if isinstance(node.right, ast.Constant) and node.right.value == 2:
+                return f"square({left})"
+            raise ValueError("Only squaring (** 2) is supported")
+        operation = _BINARY_OPERATORS.get(type(node.op))
+        if operation is None:
+            raise ValueError(f"Unsupported operator: {type(node.op).__name__}")
+        return f"{operation}({left}, {right})"
+
+    def visit_UnaryOp(self, node):
+        operand = self.visit(node.operand)
+        if isinstance(node.op, ast.USub):
+            return f"subtract(0, {operand})"
+        if isinstance(node.op, ast.UAdd):
+            return operand
+        raise ValueError(f"Unsupported operator: {type(node.op).__name__}")
+
+    def visit_Call(self, node):
+        if (
+            not isinstance(node.func, ast.Name)
+            or node.func.id not in _OPERATIONS
+            or node.keywords
+        ):
+            raise ValueError("Only calculator operations may be called")
+        expected = _ARITY[node.func.id]
+        if len(node.args) != expected:
+            raise ValueError(
+                f"{node.func.id}() takes {expected} argument(s), "
+                f"got {len(node.args)}"
+            )
+        arguments = ", ".join(self.visit(argument) for argument in node.args)
+        return f"{node.func.id}({arguments})"
+
+    def visit_Constant(self, node):
+        if isinstance(node.value, bool) or not isinstance(node.value, (int, float)):
+            raise ValueError(f"Unsupported constant: {node.value!r}")
+        if not math.isfinite(node.value):
+            raise ValueError(f"Constant out of range: {node.value!r}")
+        return repr(node.value)
+
+    def visit_Name(self, node):
+        if node.id in _OPERATIONS:
+            raise ValueError(f"{node.id!r} is an operation, not a variable")
+        if node.id not in self.variables:
+            self.variables.append(node.id)
+        return f"_{node.id}"
+
+
+@lru_cache(maxsize=256)
+def compile_expression(formula):
+    """Parse a formula once and return a cached Expression.
+
+    Variables are ordered by first appearance in the formula.
+    """
+    try:
+        tree = ast.parse(formula, mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"Invalid formula: {formula!r}") from e
+
+    translator = _Translator()
+    body = translator.visit(tree)
+    parameters = ", ".join(f"_{name}" for name in translator.variables)
+    function = eval(f"lambda {parameters}: {body}", dict(_OPERATIONS))
+    return Expression(formula, tuple(translator.variables), function)
+
+
+def evaluate(formula, **values):
+    """Evaluate a formula for a single set of variable values."""
+    return compile_expression(formula).evaluate(**values)
@@ -0,0 +1,68 @@
+import pytest
+
+from expression import compile_expression, evaluate
+
+
+def test_evaluate():
+    assert evaluate("(a + b) * c / d", a=1, b=2, c=4, d=2) == 6
+    assert evaluate("a - b", a=1, b=3) == -2
+    assert evaluate("-a + 2", a=5) == -3
+
+
+def test_square():
+    assert evaluate("a ** 2", a=3) == 9
+    assert evaluate("square(a) + 1", a=-2) == 5
+
+
+def test_compile_expression_is_cached():
+    expression = compile_expression("x * y")
+    assert compile_expression("x * y") is expression
+    assert expression.variables == ("x", "y")
+
+
+def test_evaluate_many():
+    expression = compile_expression("(a + b) * c")
+    bindings = [{"a": 1, "b": 2, "c": 3}, {"a": 0, "b": 0, "c": 5}]
+    assert expression.evaluate_many(bindings) == [9, 0]
+
+
+def test_evaluate_columns():
+    expression = compile_expression("a / b")
+    assert expression.evaluate_columns(a=[6, 5], b=[2, 2]) == [3, 2.5]
+    with pytest.raises(ValueError):
+        expression.evaluate_columns(a=[1, 2], b=[1])
+
+
+def test_divide_by_zero():
+    with pytest.raises(ValueError):
+        evaluate("a / b", a=1, b=0)
+
+
+@pytest.mark.parametrize(
+    "formula",
+    [
+        "a % b",
+        "a ** 3",
+        "__import__('os')",
+        "a.b",
+        "'text'",
+        "add",
+        "a +",
+        "add(a)",
+        "square(a, b)",
+        "a + 1e999",
+    ],
+)
+def test_invalid_formula(formula):
+    with pytest.raises(ValueError):
+        compile_expression(formula)
+
+
+def test_missing_variable():
+    expression = compile_expression("a * b + c")
+    with pytest.raises(ValueError, match="b, c"):
+        expression.evaluate(a=1)
+    with pytest.raises(ValueError, match="c"):
+        expression.evaluate_many([{"a": 1, "b": 2, "c": 3}, {"a": 1, "b": 2}])
+    with pytest.raises(ValueError, match="a"):
+        expression.evaluate_columns(b=[1], c=[2])
@@ -1,12 +1,165 @@
+import asyncio
 import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Load environment variables from .env file if it exists
 load_dotenv()
 
 
+class CircuitOpenError(requests.exceptions.RequestException):
+    """Raised instead of making a request while the circuit is open."""
+
+
+def _is_server_error(response):
+    """Return True if response is a 5xx answer from a degraded API."""
+    return response.status_code >= 500
+
+
+class CircuitBreaker:
+    """Stop calling a failing API until it has had time to recover.
+
+    After threshold consecutive failures the circuit opens and calls fail
+    immediately with CircuitOpenError. A call fails if it raises, or if
+    is_failure is given and returns True for its result. Once reset_timeout seconds have
+    passed, a single trial call is let through: success closes the circuit
+    again, failure reopens it.
+    """
+
+    def __init__(self, threshold=5, reset_timeout=30.0, clock=time.monotonic):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self._clock = clock
+        self._opened_at = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self):
+        """Return True while calls are being short-circuited."""
+        return self._opened_at is not None
+
+    def call(self, function, is_failure=None):
+        """Call function unless the circuit is open, tracking the outcome.
+
+        A result that is_failure rejects is still returned to the caller, but
+        counts towards opening the circuit.
+        """
+        with self._lock:
+            if self._opened_at is not None:
+                waited = self._clock() - self._opened_at
+                if waited < self.reset_timeout or self._trial_running:
+                    raise CircuitOpenError("Circuit open: API calls are suspended")
+                self._trial_running = True
+
+        try:
+            result = function()
+        except Exception:
+            self._record(failed=True)
+            raise
+        self._record(failed=is_failure is not None and is_failure(result))
+        return result
+
+    def _record(self, failed):
+        """Update the circuit after a call has finished."""
+        with self._lock:
+            self._trial_running = False
+            if not failed:
+                self.failures = 0
+                self._opened_at = None
+                return
+            self.failures += 1
+            if self._opened_at is not None or self.failures >= self.threshold:
+                self._opened_at = self._clock()
+
+
+class ResponseCache:
+    """An in-memory LRU cache of API responses with a time-to-live.
+
+    Entries keep the ETag and Last-Modified validators of their response, so
+    an expired entry is revalidated with a conditional request and reused if
+    the API answers 304 Not Modified. Cached data is shared between callers
+    and must be treated as read-only.
+    """
+
+    def __init__(self, ttl, max_size=128, clock=time.monotonic):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def fetch(self, url, request):
+        """Return the data for url, calling request(headers) when needed.
+
+        request receives the conditional headers to send and must return a
+        requests.Response.
+        """
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+                if now < entry["expires"]:
+                    self.hits += 1
+                    return entry["data"]
+
+        headers = {}
+        if entry is not None:
+            if entry["etag"]:
+                headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = request(headers)
+        if entry is not None and response.status_code == 304:
+            with self._lock:
+                entry["expires"] = now + self.ttl
+                self.revalidated += 1
+            return entry["data"]
+
+        data = response.json()
+        with self._lock:
+            self.misses += 1
+            if response.status_code == 200:
+                self._entries[url] = {
+                    "data": data,
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "expires": now + self.ttl,
+                }
+                self._entries.move_to_end(url)
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+        return data
+
+    def clear(self):
+        """Remove every cached response."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """Return the hit, miss and revalidation counters and the size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidated": self.revalidated,
+                "size": len(self._entries),
+            }
+
+
 class ConfigApp:
     """A simple application that uses environment variables for configuration."""
 
@@ -15,32 +168,116 @@ class ConfigApp:
         self.api_url = os.getenv("API_URL", "https://api.example.com")
         self.api_key = os.getenv("API_KEY")
         self.debug_mode = os.getenv("DEBUG_MODE", "False").lower() == "true"
+        self.timeout = float(os.getenv("API_TIMEOUT", "10"))
+        self.pool_size = int(os.getenv("API_POOL_SIZE", "10"))
+        self.keep_alive = os.getenv("API_KEEP_ALIVE", "True").lower() == "true"
+        self.cache_ttl = float(os.getenv("API_CACHE_TTL", "0"))
+        self.cache_size = int(os.getenv("API_CACHE_SIZE", "128"))
+        self.max_retries = int(os.getenv("API_MAX_RETRIES", "2"))
+        self.backoff_factor = float(os.getenv("API_BACKOFF_FACTOR", "0.5"))
+        self.circuit_threshold = int(os.getenv("API_CIRCUIT_THRESHOLD", "5"))
+        self.circuit_reset = float(os.getenv("API_CIRCUIT_RESET", "30"))
 
         if not self.api_key:
             raise ValueError("API_KEY environment variable is required")
 
+        self.session = self._create_session()
+        # Caching is off unless API_CACHE_TTL is set to a positive number.
+        self.cache = None
+        if self.cache_ttl > 0:
+            self.cache = ResponseCache(self.cache_ttl, self.cache_size)
+        # API_CIRCUIT_THRESHOLD=0 disables the circuit breaker.
+        self.circuit_breaker = None
+        if self.circuit_threshold > 0:
+            self.circuit_breaker = CircuitBreaker(
+                self.circuit_threshold, self.circuit_reset
+            )
+
+    def _connection_pool_size(self):
+        """Return how many connections the session should keep per host."""
+        return self.pool_size
+
+    def _create_session(self):
+        """Create a pooled session that carries the auth headers."""
+        pool_size = self._connection_pool_size()
+        session = requests.Session()
+        # Only idempotent methods such as GET are retried, with exponential
+        # backoff, on connection errors and gateway errors.
+        retry = Retry(
+            total=self.max_retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=(502, 503, 504),
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=retry,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update(
+            {
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json",
+            }
+        )
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def close(self):
+        """Close the session and its pooled connections."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
     def get_config(self):
         """Return the current configuration."""
         return {
             "api_url": self.api_url,
             "api_key": "********" if self.api_key else None,  # Mask the API key
             "debug_mode": self.debug_mode,
+            "timeout": self.timeout,
+            "pool_size": self.pool_size,
+            "keep_alive": self.keep_alive,
+            "cache_ttl": self.cache_ttl,
+            "cache_size": self.cache_size,
+            "max_retries": self.max_retries,
+            "backoff_factor": self.backoff_factor,
+            "circuit_threshold": self.circuit_threshold,
+            "circuit_reset": self.circuit_reset,
         }
 
     def make_api_request(self, endpoint):
         """Make a request to the API using the configured credentials."""
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
-
         url = f"{self.api_url}/{endpoint}"
 
         if self.debug_mode:
             print(f"Making request to: {url}")
 
-        response = requests.get(url, headers=headers)
-        return response.json()
+        if self.cache is not None:
+            return self.cache.fetch(
+                url, lambda headers: self._get(url, headers=headers)
+            )
+
+        return self._get(url).json()
+
+    def _get(self, url, **kwargs):
+        """Send a GET request through the circuit breaker, if enabled.
+
+        Server errors (5xx) count as failures, as well as exceptions.
+        """
+
+        def request():
+            return self.session.get(url, timeout=self.timeout, **kwargs)
+
+        if self.circuit_breaker is None:
+            return request()
+        return self.circuit_breaker.call(request, is_failure=_is_server_error)
 
     def validate_connection(self):
         """Validate the connection to the API."""
@@ -51,3 +288,78 @@ class ConfigApp:
             if self.debug_mode:
                 print(f"Connection error: {str(e)}")
             return False
+
+
+class AsyncConfigApp(ConfigApp):
+    """An asyncio counterpart of ConfigApp for concurrent API requests.
+
+    It is configured from the same environment variables as ConfigApp, plus
+    API_CONCURRENCY for the number of requests allowed in flight at once.
+    Requests go through the pooled session on a dedicated thread pool, so
+    the event loop is never blocked.
+    """
+
+    def __init__(self):
+        self.concurrency = int(os.getenv("API_CONCURRENCY", "10"))
+        super().__init__()
+        self._executor = ThreadPoolExecutor(max_workers=self.concurrency)
+
+    def _connection_pool_size(self):
+        """Keep at least one connection per concurrent request."""
+        return max(self.pool_size, self.concurrency)
+
+    def get_config(self):
+        """Return the current configuration."""
+        config = super().get_config()
+        config["concurrency"] = self.concurrency
+        return config
+
+    async def fetch(self, endpoint):
+        """Make a request to the API without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, self.make_api_request, endpoint
+        )
+
+    async def fetch_many(self, endpoints, concurrency=None, return_exceptions=False):
+        """Fetch many endpoints concurrently and return results in order.
+
+        At most concurrency requests (API_CONCURRENCY by default) are in
+        flight at once. concurrency can only lower that limit, since the
+        thread pool is sized to API_CONCURRENCY; a larger value raises
+        ValueError. With return_exceptions set, a failed request yields its
+        exception in place of a result instead of failing the batch.
+        """
+        if concurrency is None:
+            concurrency = self.concurrency
+        elif not 1 <= concurrency <= self.concurrency:
+            raise ValueError(
+                f"concurrency must be between 1 and API_CONCURRENCY "
+                f"({self.concurrency}), got {concurrency}"
+            )
+        limit = asyncio.Semaphore(concurrency)
+
+        async def fetch_one(endpoint):
+            async with limit:
+                return await self.fetch(endpoint)
+
+        return await asyncio.gather(
+            *(fetch_one(endpoint) for endpoint in endpoints),
+            return_exceptions=return_exceptions,
+        )
+
+    def close(self):
+        """Shut down the thread pool and close the session."""
+        self._executor.shutdown(wait=True)
+        super().close()
+
+    async def __aenter__(self):
+        return self
+
+    async def aclose(self):
+        """Close like close(), waiting for in-flight requests off the loop."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.close)
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
@@ -1,8 +1,20 @@
+import asyncio
+import json
 import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import MagicMock, patch
 
 import pytest
-from config_app import ConfigApp
+import requests
+from config_app import (
+    AsyncConfigApp,
+    CircuitBreaker,
+    CircuitOpenError,
+    ConfigApp,
+    ResponseCache,
+)
 
 
 def test_config_app_initialization():
@@ -40,13 +52,17 @@ def test_config_app_default_values():
 
         assert config["api_url"] == "https://api.example.com"  # Default value
         assert config["debug_mode"] is False  # Default value
+        assert config["timeout"] == 10.0  # Default value
+        assert config["pool_size"] == 10  # Default value
+        assert config["keep_alive"] is True  # Default value
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_make_api_request(mock_get):
     """Test that the make_api_request method works correctly."""
     # Set up the mock response
     mock_response = MagicMock()
+    mock_response.status_code = 200
     mock_response.json.return_value = {"data": "test data"}
     mock_get.return_value = mock_response
 
@@ -64,21 +80,20 @@ def test_make_api_request(mock_get):
 
         # Verify the request was made correctly
         mock_get.assert_called_once_with(
-            "https://test-api.example.com/test-endpoint",
-            headers={
-                "Authorization": "Bearer test-api-key",
-                "Content-Type": "application/json",
-            },
+            "https://test-api.example.com/test-endpoint", timeout=10.0
         )
+        assert app.session.headers["Authorization"] == "Bearer test-api-key"
+        assert app.session.headers["Content-Type"] == "application/json"
 
         assert result == {"data": "test data"}
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_validate_connection_success(mock_get):
     """Test that the validate_connection method returns True when the API is healthy."""
     # Set up the mock response
     mock_response = MagicMock()
+    mock_response.status_code = 200
     mock_response.json.return_value = {"status": "ok"}
     mock_get.return_value = mock_response
 
@@ -93,7 +108,7 @@ def test_validate_connection_success(mock_get):
         assert result is True
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_validate_connection_failure(mock_get):
     """Test that the validate_connection method returns False when the API is not healthy."""
     # Set up the mock response to raise an exception
@@ -112,3 +127,348 @@ def test_validate_connection_failure(mock_get):
         result = app.validate_connection()
 
         assert result is False
+
+
+def test_session_configuration():
+    """Test that the pooled session is configured from environment variables."""
+    with patch.dict(
+        os.environ,
+        {
+            "API_KEY": "test-api-key",
+            "API_TIMEOUT": "2.5",
+            "API_POOL_SIZE": "4",
+            "API_KEEP_ALIVE": "False",
+        },
+    ):
+        with ConfigApp() as app:
+            adapter = app.session.get_adapter("https://api.example.com")
+
+            assert app.timeout == 2.5
+            assert adapter._pool_maxsize == 4
+            assert app.session.headers["Connection"] == "close"
+
+
+@patch("requests.Session.get")
+def test_session_is_reused(mock_get):
+    """Test that repeated requests go through the same session."""
+    mock_get.return_value.status_code = 200
+    mock_get.return_value.json.return_value = {}
+
+    with patch.dict(os.environ, {"API_KEY": "test-api-key"}):
+        app = ConfigApp()
+        session = app.session
+        app.make_api_request("a")
+        app.make_api_request("b")
+
+        assert app.session is session
+        assert mock_get.call_count == 2
+
+
+@pytest.fixture
+def api_server():
+    """Run a local stand-in API that echoes the requested path after a delay."""
+
+    attempts = {}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            # /flaky/<n> answers 503 to the first n attempts, and
+            # /error/<status> always answers with that status.
+            attempts[self.path] = attempts.get(self.path, 0) + 1
+            if self.path.startswith("/error/"):
+                self.send_response(int(self.path.rsplit("/", 1)[1]))
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            if self.path.startswith("/flaky/"):
+                if attempts[self.path] <= int(self.path.rsplit("/", 1)[1]):
+                    self.send_response(503)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+            else:
+                time.sleep(0.1)
+            body = json.dumps(
+                {
+                    "path": self.path,
+                    "auth": self.headers["Authorization"],
+                    "attempt": attempts[self.path],
+                }
+            ).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_async_fetch_many(api_server):
+    """Test fetching many endpoints concurrently against a local server."""
+    endpoints = [f"item/{i}" for i in range(20)]
+
+    async def fetch_all():
+        async with AsyncConfigApp() as app:
+            return await app.fetch_many(endpoints)
+
+    with patch.dict(
+        os.environ,
+        {"API_URL": api_server, "API_KEY": "test-api-key", "API_CONCURRENCY": "10"},
+    ):
+        start = time.perf_counter()
+        results = asyncio.run(fetch_all())
+        elapsed = time.perf_counter() - start
+
+    assert [result["path"] for result in results] == [f"/{e}" for e in endpoints]
+    assert all(result["auth"] == "Bearer test-api-key" for result in results)
+    # 20 requests of 0.1s each with 10 in flight take about 0.2s, not 2s.
+    assert elapsed < 1.5
+
+
+def test_async_fetch_many_return_exceptions():
+    """Test that failures can be returned in place instead of raised."""
+
+    async def fetch_all(app):
+        return await app.fetch_many(["ok", "bad"], return_exceptions=True)
+
+    def fake_request(endpoint):
+        if endpoint == "bad":
+            raise ValueError("bad endpoint")
+        return {"endpoint": endpoint}
+
+    with patch.dict(os.environ, {"API_KEY": "test-api-key"}):
+        app = AsyncConfigApp()
+        with patch.object(app, "make_api_request", side_effect=fake_request):
+            results = asyncio.run(fetch_all(app))
+        app.close()
+
+    assert results[0] == {"endpoint": "ok"}
+    assert isinstance(results[1], ValueError)
+
+
+def test_async_close_does_not_block_event_loop():
+    """Test that leaving the context waits for requests off the event loop."""
+    ticks = []
+
+    async def tick():
+        while True:
+            ticks.append(time.perf_counter())
+            await asyncio.sleep(0.01)
+
+    async def run(app):
+        ticker = asyncio.create_task(tick())
+        async with app:
+            loop = asyncio.get_running_loop()
+            request = loop.run_in_executor(app._executor, time.sleep, 0.3)
+            await asyncio.sleep(0)
+        ticker.cancel()
+        await request
+        return ticks
+
+    with patch.dict(os.environ, {"API_KEY": "test-api-key"}):
+        ticks = asyncio.run(run(AsyncConfigApp()))
+
+    # The ticker kept running while the pool drained its 0.3s request.
+    assert len(ticks) > 5
+    assert max(b - a for a, b in zip(ticks, ticks[1:])) < 0.2
+
+
+def test_async_pool_size_and_concurrency_limit():
+    """Test that the pool fits API_CONCURRENCY without changing pool_size."""
+    with patch.dict(
+        os.environ,
+        {"API_KEY": "test-api-key", "API_POOL_SIZE": "4", "API_CONCURRENCY": "8"},
+    ):
+        app = AsyncConfigApp()
+
+    adapter = app.session.get_adapter("https://api.example.com")
+    assert adapter._pool_maxsize == 8
+    assert app.get_config()["pool_size"] == 4
+
+    for concurrency in (0, 9):
+        with pytest.raises(ValueError):
+            asyncio.run(app.fetch_many(["a"], concurrency=concurrency))
+    app.close()
+
+
+def make_response(status_code=200, data=None, headers=None):
+    """Build a mock response for cache tests."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = data
+    response.headers = headers or {}
+    return response
+
+
+def test_response_cache_ttl_and_revalidation():
+    """Test that fresh entries are served locally and stale ones revalidated."""
+    now = [0.0]
+    cache = ResponseCache(ttl=10, clock=lambda: now[0])
+    request = MagicMock(
+        side_effect=[
+            make_response(data={"v": 1}, headers={"ETag": '"abc"'}),
+            make_response(status_code=304),
+        ]
+    )
+
+    assert cache.fetch("url", request) == {"v": 1}
+    assert cache.fetch("url", request) == {"v": 1}
+    assert request.call_count == 1
+
+    now[0] = 11.0
+    assert cache.fetch("url", request) == {"v": 1}
+    request.assert_called_with({"If-None-Match": '"abc"'})
+
+    assert cache.stats() == {"hits": 1, "misses": 1, "revalidated": 1, "size": 1}
+
+
+def test_response_cache_lru_eviction():
+    """Test that the least recently used entry is evicted when full."""
+    cache = ResponseCache(ttl=60, max_size=2)
+
+    def request(headers):
+        return make_response(data={})
+
+    for url in ["a", "b", "a", "c"]:
+        cache.fetch(url, request)
+
+    assert cache.stats()["size"] == 2
+    assert cache.stats()["hits"] == 1
+    cache.fetch("b", request)
+    assert cache.stats()["misses"] == 4  # "b" was evicted, "a" was kept
+
+
+@patch("requests.Session.get")
+def test_make_api_request_uses_cache(mock_get):
+    """Test that ConfigApp serves repeated requests from its cache."""
+    mock_get.return_value = make_response(
+        data={"status": "ok"}, headers={"Last-Modified": "Mon, 01 Jan 2024"}
+    )
+
+    with patch.dict(os.environ, {"API_KEY": "test-api-key", "API_CACHE_TTL": "60"}):
+        app = ConfigApp()
+        assert app.validate_connection() is True
+        assert app.validate_connection() is True
+
+    assert mock_get.call_count == 1
+    assert app.cache.stats()["hits"] == 1
+
+
+def test_circuit_breaker_opens_and_recovers():
+    """Test that the breaker opens after repeated failures and then recovers."""
+    now = [0.0]
+    breaker = CircuitBreaker(threshold=2, reset_timeout=30, clock=lambda: now[0])
+    failing = MagicMock(side_effect=ConnectionError("down"))
+
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            breaker.call(failing)
+    assert breaker.is_open
+
+    with pytest.raises(CircuitOpenError):
+        breaker.call(failing)
+    assert failing.call_count == 2  # short-circuited without calling
+
+    now[0] = 31.0
+    with pytest.raises(ConnectionError):
+        breaker.call(failing)  # the trial call fails, so it reopens
+    assert breaker.is_open
+
+    now[0] = 62.0
+    assert breaker.call(lambda: "ok") == "ok"
+    assert not breaker.is_open
+    assert breaker.failures == 0
+
+
+@patch("requests.Session.get")
+def test_validate_connection_circuit_open(mock_get):
+    """Test that validate_connection stops calling the API once the circuit opens."""
+    mock_get.side_effect = requests.exceptions.ConnectionError("down")
+
+    with patch.dict(
+        os.environ, {"API_KEY": "test-api-key", "API_CIRCUIT_THRESHOLD": "3"}
+    ):
+        app = ConfigApp()
+        results = [app.validate_connection() for _ in range(5)]
+
+    assert results == [False] * 5
+    assert mock_get.call_count == 3
+    assert app.circuit_breaker.is_open
+
+
+def test_circuit_breaker_counts_server_errors(api_server):
+    """Test that 5xx answers open the circuit even though they do not raise."""
+    with patch.dict(
+        os.environ,
+        {
+            "API_URL": api_server,
+            "API_KEY": "test-api-key",
+            "API_MAX_RETRIES": "0",
+            "API_CIRCUIT_THRESHOLD": "2",
+        },
+    ):
+        with ConfigApp() as app:
+            for _ in range(2):
+                with pytest.raises(ValueError):
+                    app.make_api_request("error/500")
+            assert app.circuit_breaker.is_open
+            with pytest.raises(CircuitOpenError):
+                app.make_api_request("error/500")
+
+
+def test_circuit_breaker_ignores_client_errors(api_server):
+    """Test that 4xx answers do not count against the API."""
+    with patch.dict(
+        os.environ,
+        {
+            "API_URL": api_server,
+            "API_KEY": "test-api-key",
+            "API_CIRCUIT_THRESHOLD": "2",
+        },
+    ):
+        with ConfigApp() as app:
+            for _ in range(3):
+                with pytest.raises(ValueError):
+                    app.make_api_request("error/404")
+            assert not app.circuit_breaker.is_open
+
+
+def test_retries_on_gateway_errors(api_server):
+    """Test that GET requests are retried on 503 responses."""
+    with patch.dict(
+        os.environ,
+        {
+            "API_URL": api_server,
+            "API_KEY": "test-api-key",
+            "API_MAX_RETRIES": "2",
+            "API_BACKOFF_FACTOR": "0",
+        },
+    ):
+        with ConfigApp() as app:
+            result = app.make_api_request("flaky/2")
+
+    assert result["path"] == "/flaky/2"
+    assert result["attempt"] == 3
+
+
+def test_retry_configuration():
+    """Test that retries and timeouts are configured from the environment."""
+    with patch.dict(
+        os.environ,
+        {"API_KEY": "test-api-key", "API_MAX_RETRIES": "4", "API_BACKOFF_FACTOR": "1"},
+    ):
+        app = ConfigApp()
+
+    retry = app.session.get_adapter("https://api.example.com").max_retries
+    assert retry.total == 4
+    assert retry.backoff_factor == 1.0
+    assert 503 in retry.status_forcelist
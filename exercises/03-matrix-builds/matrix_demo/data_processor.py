@@ -5,9 +5,35 @@ Some of these functions may behave differently across Python versions,
 making them good candidates for matrix testing.
 """
 
+import datetime
+import io
 import json
+import os
 import sys
-from typing import Any, Dict, List, Union
+from collections import Counter, deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from functools import lru_cache, partial
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Union,
+)
+
+_EXECUTORS = {"thread": ThreadPoolExecutor, "process": ProcessPoolExecutor}
 
 
 def process_data(data: Union[Dict[str, Any], List[Any]]) -> Dict[str, Any]:
@@ -42,17 +68,313 @@ def process_data(data: Union[Dict[str, Any], List[Any]]) -> Dict[str, Any]:
     return result
 
 
-def serialize_data(data: Any) -> str:
+def process_data_stream(
+    data: Union[Dict[str, Any], Iterable[Any]], sample_size: int = 0
+) -> Dict[str, Any]:
+    """
+    Process data in a single pass and return a summary.
+
+    Unlike process_data, this accepts any iterable, including generators,
+    and never copies the input: the summary holds a count, a histogram of
+    item types and at most sample_size sampled keys and values. For
+    dictionaries the type histogram describes the values.
+    """
+    result = {
+        "python_version": f"{sys.version_info.major}.{sys.version_info.minor}",
+        "data_type": type(data).__name__,
+        "processed": False,
+        "summary": {},
+    }
+
+    if isinstance(data, dict):
+        keys = list(islice(data, sample_size))
+        items = data.values()
+    elif isinstance(data, (str, bytes)) or not isinstance(data, Iterable):
+        return result
+    else:
+        keys = None
+        items = data
+
+    iterator = iter(items)
+    values = list(islice(iterator, sample_size))
+    # Counter.update counts in C, so the per-item work stays minimal.
+    counts = Counter(map(type, values))
+    counts.update(map(type, iterator))
+
+    types = Counter()
+    for item_type, count in counts.items():
+        types[item_type.__name__] += count
+    length = sum(counts.values())
+
+    result["processed"] = True
+    result["summary"] = {"length": length, "type_counts": dict(types)}
+    if sample_size:
+        if keys is not None:
+            result["summary"]["sample_keys"] = keys
+        result["summary"]["sample_values"] = values
+
+    return result
+
+
+def _process_chunk(
+    processor: Callable[[Any], Dict[str, Any]], chunk: List[Any]
+) -> List[Dict[str, Any]]:
+    """Process one chunk of payloads inside a worker."""
+    return [processor(payload) for payload in chunk]
+
+
+def process_data_batch(
+    payloads: Iterable[Any],
+    executor: str = "process",
+    max_workers: Optional[int] = None,
+    chunk_size: int = 100,
+    ordered: bool = True,
+    processor: Callable[[Any], Dict[str, Any]] = process_data,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Process many payloads concurrently and yield their summaries.
+
+    Payloads are sent to a "thread" or "process" pool in chunks of
+    chunk_size. At most two chunks per worker are in flight at a time, so
+    memory stays bounded however many payloads there are. Results are
+    yielded in input order, or as soon as each chunk completes when ordered
+    is False. processor must be picklable when using processes.
+    """
+    if executor not in _EXECUTORS:
+        raise ValueError(f"Unsupported executor: {executor}")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_in_flight = 2 * max_workers
+    iterator = iter(payloads)
+    pending: Deque[Future] = deque()
+
+    with _EXECUTORS[executor](max_workers=max_workers) as pool:
+
+        def submit_chunks() -> None:
+            while len(pending) < max_in_flight:
+                chunk = list(islice(iterator, chunk_size))
+                if not chunk:
+                    return
+                pending.append(pool.submit(_process_chunk, processor, chunk))
+
+        submit_chunks()
+        while pending:
+            if ordered:
+                done = [pending.popleft()]
+            else:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                done = [future for future in pending if future in finished]
+                for future in done:
+                    pending.remove(future)
+            # Refill the pool before handing results to the caller so the
+            # workers stay busy while the results are consumed.
+            submit_chunks()
+            for future in done:
+                yield from future.result()
+
+
+def _json_default(value: Any) -> Any:
+    """Encode NumPy and datetime values for backends without native support."""
+    if type(value).__module__ == "numpy" and hasattr(value, "tolist"):
+        return value.tolist()
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _serialize_json(data: Any) -> str:
+    return json.dumps(data, sort_keys=True, default=_json_default)
+
+
+# Serializer backends, keyed by name. Each takes the data and returns the
+# encoded JSON as str or bytes, with keys sorted for deterministic output.
+_SERIALIZERS: Dict[str, Callable[[Any], Union[str, bytes]]] = {
+    "json": _serialize_json,
+}
+
+try:
+    import orjson
+
+    _SERIALIZERS["orjson"] = lambda data: orjson.dumps(
+        data,
+        default=_json_default,
+        option=(
+            orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        ),
+    )
+except ImportError:
+    pass
+
+try:
+    import msgspec
+
+    _msgspec_encode = msgspec.json.Encoder(
+        enc_hook=_json_default, order="sorted"
+    ).encode
+
+    def _serialize_msgspec(data: Any) -> Union[str, bytes]:
+        # msgspec can only sort str keys; anything else goes through json.
+        try:
+            return _msgspec_encode(data)
+        except TypeError:
+            return _serialize_json(data)
+
+    _SERIALIZERS["msgspec"] = _serialize_msgspec
+except (ImportError, TypeError):
+    pass
+
+try:
+    import ujson
+
+    _SERIALIZERS["ujson"] = lambda data: ujson.dumps(
+        data, sort_keys=True, default=_json_default, escape_forward_slashes=False
+    )
+except ImportError:
+    pass
+
+# Preference order for backend="auto", fastest first.
+_AUTO_SERIALIZERS = ("orjson", "msgspec", "ujson", "json")
+
+
+def available_serializers() -> List[str]:
+    """Return the names of the serializer backends that can be used."""
+    return sorted(_SERIALIZERS)
+
+
+def register_serializer(
+    name: str, serializer: Callable[[Any], Union[str, bytes]]
+) -> None:
+    """
+    Register a serializer backend.
+
+    serializer takes the data and returns JSON as str or bytes. It should
+    sort keys so output stays deterministic, and raise TypeError or
+    ValueError for data it cannot encode.
+    """
+    _SERIALIZERS[name] = serializer
+
+
+def _serialize_with_fallback(
+    serializer: Callable[[Any], Union[str, bytes]], data: Any
+) -> Union[str, bytes]:
+    """
+    Serialize data with a fast backend, falling back to the json module.
+
+    Data the fast encoder rejects is encoded again with json. Its output is
+    not otherwise checked, so NaN and infinity may come out as null, and data
+    json rejects, such as a dict mixing str and int keys, may be encoded.
+    """
+    try:
+        return serializer(data)
+    except (TypeError, ValueError, OverflowError):
+        return _serialize_json(data)
+
+
+def _get_serializer(backend: str) -> Callable[[Any], Union[str, bytes]]:
+    if backend == "auto":
+        backend = next(name for name in _AUTO_SERIALIZERS if name in _SERIALIZERS)
+        if backend != "json":
+            return partial(_serialize_with_fallback, _SERIALIZERS[backend])
+    try:
+        return _SERIALIZERS[backend]
+    except KeyError:
+        raise ValueError(f"Unknown serializer backend: {backend}") from None
+
+
+def serialize_data(
+    data: Any, backend: str = "json", as_bytes: bool = False
+) -> Union[str, bytes]:
     """
     Serialize data to JSON.
 
     This function may behave differently across Python versions,
     especially with handling of non-serializable objects.
+
+    backend selects the encoder: "json" (the standard library, the default),
+    "orjson", "msgspec" or "ujson" when installed, or "auto" for the fastest
+    one available, falling back to "json" for data that one rejects. orjson
+    and msgspec write NaN and infinity as null, where "json" writes the
+    non-standard NaN and Infinity. Only "json" puts spaces after separators.
+    With as_bytes set, UTF-8 bytes are returned, which avoids a decode for
+    the backends that produce bytes natively. Keys are always sorted, and NumPy values
+    and datetimes are supported by every backend.
     """
+    serializer = _get_serializer(backend)
     try:
-        return json.dumps(data, sort_keys=True)
-    except TypeError as e:
-        return f"Error serializing data: {str(e)}"
+        encoded = serializer(data)
+    except (TypeError, ValueError, OverflowError) as e:
+        encoded = f"Error serializing data: {str(e)}"
+
+    if as_bytes:
+        return encoded if isinstance(encoded, bytes) else encoded.encode("utf-8")
+    return encoded.decode("utf-8") if isinstance(encoded, bytes) else encoded
+
+
+def _iter_ndjson(
+    records: Iterable[Any], serializer: Callable[[Any], Union[str, bytes]]
+) -> Iterator[Union[str, bytes]]:
+    for record in records:
+        yield serializer(record)
+        yield "\n"
+
+
+def serialize_data_to(
+    data: Any,
+    fp: Any,
+    backend: str = "json",
+    ndjson: bool = False,
+    chunk_size: int = 65536,
+) -> int:
+    """
+    Serialize data as JSON directly to a file-like object or socket.
+
+    Output is written in chunks of about chunk_size as it is encoded, so the
+    full document never has to exist as one string. With the "json" backend
+    a single document is encoded incrementally; the other backends encode
+    it in one call. With ndjson set, data must be an iterable of records,
+    each written on its own line. Text streams receive str and everything
+    else receives UTF-8 bytes; objects without write() but with sendall(),
+    such as sockets, are supported too.
+
+    Unlike serialize_data, encoding errors are raised rather than returned,
+    since part of the output may already have been written. Returns the
+    number of characters or bytes written.
+    """
+    serializer = _get_serializer(backend)
+    text = isinstance(fp, io.TextIOBase)
+    write = fp.write if hasattr(fp, "write") else fp.sendall
+
+    if ndjson:
+        chunks = _iter_ndjson(data, serializer)
+    elif serializer is _serialize_json:
+        encoder = json.JSONEncoder(sort_keys=True, default=_json_default)
+        chunks = encoder.iterencode(data)
+    else:
+        chunks = iter([serializer(data)])
+
+    empty = "" if text else b""
+    written = 0
+    buffer: List[Union[str, bytes]] = []
+    buffered = 0
+    for chunk in chunks:
+        if text and isinstance(chunk, bytes):
+            chunk = chunk.decode("utf-8")
+        elif not text and isinstance(chunk, str):
+            chunk = chunk.encode("utf-8")
+        buffer.append(chunk)
+        buffered += len(chunk)
+        if buffered >= chunk_size:
+            write(empty.join(buffer))
+            written += buffered
+            buffer, buffered = [], 0
+    if buffer:
+        write(empty.join(buffer))
+        written += buffered
+
+    return written
 
 
 def parse_version_specific(version_str: str) -> Dict[str, int]:
@@ -73,3 +395,36 @@ def parse_version_specific(version_str: str) -> Dict[str, int]:
         result["micro"] = int(parts[2])
 
     return result
+
+
+class Version(NamedTuple):
+    """
+    A parsed version string.
+
+    Versions are plain tuples underneath, so they are compact, hashable and
+    ordered component by component. Missing components default to 0, so
+    "3.8" and "3.8.0" compare equal.
+    """
+
+    major: int
+    minor: int = 0
+    micro: int = 0
+
+    def __str__(self) -> str:
+        return f"{self.major}.{self.minor}.{self.micro}"
+
+
+@lru_cache(maxsize=1024)
+def parse_version(version_str: str) -> Version:
+    """
+    Parse a version string into a Version.
+
+    Results are cached, so repeatedly parsing the same few versions costs a
+    dictionary lookup. Components after the third are ignored.
+    """
+    return Version(*map(int, version_str.split(".")[:3]))
+
+
+def parse_versions(version_strs: Iterable[str]) -> List[Version]:
+    """Parse many version strings, reusing cached results."""
+    return list(map(parse_version, version_strs))
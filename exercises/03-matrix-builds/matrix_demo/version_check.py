@@ -4,6 +4,20 @@ Version compatibility checks for the Matrix Demo package.
 
 import platform
 import sys
+import threading
+
+# Platform fields and the functions that compute them. Some of these, such as
+# platform.processor(), can shell out, so each value is computed at most once
+# per process, on first use, and cached.
+_PLATFORM_FIELDS = {
+    "system": platform.system,
+    "release": platform.release,
+    "version": platform.version,
+    "machine": platform.machine,
+    "processor": platform.processor,
+}
+_platform_cache = {}
+_platform_lock = threading.Lock()
 
 
 def get_python_version():
@@ -11,15 +25,31 @@ def get_python_version():
     return f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
 
 
+def get_platform_field(name):
+    """Return one field of platform information, computing it only once."""
+    try:
+        return _platform_cache[name]
+    except KeyError:
+        pass
+    with _platform_lock:
+        if name not in _platform_cache:
+            _platform_cache[name] = _PLATFORM_FIELDS[name]()
+        return _platform_cache[name]
+
+
+def refresh_platform_info(*names):
+    """Forget cached platform fields so they are recomputed on next use.
+
+    With no names, every field is forgotten.
+    """
+    with _platform_lock:
+        for name in names or list(_platform_cache):
+            _platform_cache.pop(name, None)
+
+
 def get_platform_info():
     """Return information about the current platform."""
-    return {
-        "system": platform.system(),
-        "release": platform.release(),
-        "version": platform.version(),
-        "machine": platform.machine(),
-        "processor": platform.processor(),
-    }
+    return {name: get_platform_field(name) for name in _PLATFORM_FIELDS}
 
 
 def check_compatibility():
@@ -2,9 +2,19 @@
 Tests for the data_processor module.
 """
 
+import datetime
+import io
+import json
+
 import pytest
-from matrix_demo.data_processor import (parse_version_specific, process_data,
-                                        serialize_data)
+from matrix_demo import data_processor
+from matrix_demo.data_processor import (Version, available_serializers,
+                                        parse_version, parse_version_specific,
+                                        parse_versions, process_data,
+                                        process_data_batch,
+                                        process_data_stream,
+                                        register_serializer, serialize_data,
+                                        serialize_data_to)
 
 
 def test_process_data_dict():
@@ -84,3 +94,264 @@ def test_parse_version_specific_incomplete():
     assert result["major"] == 3
     assert result["minor"] == 8
     assert "micro" not in result
+
+
+def test_process_data_stream_dict():
+    """Test streaming a dictionary with key and value sampling."""
+    data = {"a": 1, "b": "two", "c": 3}
+    result = process_data_stream(data, sample_size=2)
+
+    assert result["processed"] is True
+    assert result["data_type"] == "dict"
+    assert result["summary"]["length"] == 3
+    assert result["summary"]["type_counts"] == {"int": 2, "str": 1}
+    assert result["summary"]["sample_keys"] == ["a", "b"]
+    assert result["summary"]["sample_values"] == [1, "two"]
+
+
+def test_process_data_stream_generator():
+    """Test streaming a generator in a single pass."""
+    data = (i if i % 2 else str(i) for i in range(1000))
+    result = process_data_stream(data)
+
+    assert result["processed"] is True
+    assert result["data_type"] == "generator"
+    assert result["summary"] == {
+        "length": 1000,
+        "type_counts": {"str": 500, "int": 500},
+    }
+
+
+def test_process_data_stream_matches_process_data():
+    """Test that list summaries agree with process_data."""
+    data = [1, "two", 3.0, True]
+    streamed = process_data_stream(data, sample_size=10)
+    summary = process_data(data)["summary"]
+
+    assert streamed["summary"]["length"] == summary["length"]
+    assert sum(streamed["summary"]["type_counts"].values()) == len(summary["types"])
+    assert streamed["summary"]["sample_values"] == data
+
+
+def test_process_data_stream_invalid():
+    """Test streaming non-iterable and string data."""
+    assert process_data_stream(42)["processed"] is False
+    assert process_data_stream("text")["processed"] is False
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_process_data_batch_ordered(executor):
+    """Test that batch results come back in input order."""
+    payloads = ({"index": i} if i % 2 else list(range(i)) for i in range(50))
+    results = list(
+        process_data_batch(payloads, executor=executor, max_workers=2, chunk_size=3)
+    )
+
+    assert len(results) == 50
+    for i, result in enumerate(results):
+        assert result["processed"] is True
+        if i % 2:
+            assert result["summary"]["values"] == [i]
+        else:
+            assert result["summary"]["length"] == i
+
+
+def test_process_data_batch_unordered():
+    """Test yielding results as chunks complete."""
+    results = list(
+        process_data_batch(
+            [[0] * i for i in range(20)],
+            executor="thread",
+            chunk_size=4,
+            ordered=False,
+        )
+    )
+
+    assert sorted(result["summary"]["length"] for result in results) == list(range(20))
+
+
+def test_process_data_batch_bounded_in_flight():
+    """Test that only a bounded number of payloads are read ahead."""
+    consumed = []
+
+    def payloads():
+        for i in range(1000):
+            consumed.append(i)
+            yield [i]
+
+    results = process_data_batch(
+        payloads(), executor="thread", max_workers=1, chunk_size=10
+    )
+    next(results)
+
+    # One worker allows two chunks in flight plus the chunk being refilled.
+    assert len(consumed) <= 40
+    results.close()
+
+
+def test_process_data_batch_invalid_executor():
+    """Test that an unknown executor is rejected."""
+    with pytest.raises(ValueError):
+        list(process_data_batch([{}], executor="gpu"))
+
+
+@pytest.mark.parametrize("backend", available_serializers() + ["auto"])
+def test_serialize_data_backends(backend):
+    """Test that every available backend produces equivalent sorted JSON."""
+    data = {"b": [1, 2], "a": {"d": None, "c": "x/y"}}
+    result = serialize_data(data, backend=backend)
+
+    assert isinstance(result, str)
+    assert json.loads(result) == data
+    assert result.index('"a"') < result.index('"b"')
+    assert result.index('"c"') < result.index('"d"')
+
+
+@pytest.mark.parametrize("backend", available_serializers() + ["auto"])
+@pytest.mark.parametrize(
+    "data",
+    [{1: "a", 2: "b"}, {"x": float("nan")}, [float("inf"), None]],
+    ids=["int-keys", "nan", "inf"],
+)
+def test_serialize_data_backends_edge_cases(backend, data):
+    """Test that non-str keys and non-finite floats never produce errors."""
+    result = serialize_data(data, backend=backend)
+    assert not result.startswith("Error serializing data")
+    if backend == "auto":
+        # auto uses the fastest backend unless that one rejects the data.
+        fastest = next(
+            name
+            for name in ("orjson", "msgspec", "ujson", "json")
+            if name in available_serializers()
+        )
+        expected = serialize_data(data, backend=fastest)
+        if expected.startswith("Error serializing data"):
+            expected = serialize_data(data)
+        assert result == expected
+
+
+def test_serialize_data_as_bytes():
+    """Test returning UTF-8 bytes, including for errors."""
+    assert serialize_data({"a": "é"}, as_bytes=True) == b'{"a": "\\u00e9"}'
+    assert serialize_data(object(), as_bytes=True).startswith(b"Error serializing data")
+
+
+@pytest.mark.parametrize("backend", available_serializers())
+def test_serialize_data_datetime_and_numpy(backend):
+    """Test that datetimes and NumPy values are handled by every backend."""
+    data = {"when": datetime.datetime(2024, 1, 2, 3, 4, 5)}
+    assert json.loads(serialize_data(data, backend=backend)) == {
+        "when": "2024-01-02T03:04:05"
+    }
+
+    np = pytest.importorskip("numpy")
+    data = {"array": np.arange(3), "scalar": np.float64(1.5)}
+    assert json.loads(serialize_data(data, backend=backend)) == {
+        "array": [0, 1, 2],
+        "scalar": 1.5,
+    }
+
+
+def test_register_serializer(monkeypatch):
+    """Test plugging in a custom serializer backend."""
+    # Registering over a monkeypatched entry removes it again afterwards.
+    monkeypatch.setitem(data_processor._SERIALIZERS, "upper", None)
+    register_serializer("upper", lambda data: json.dumps(data).upper())
+
+    assert "upper" in available_serializers()
+    assert serialize_data({"a": "b"}, backend="upper") == '{"A": "B"}'
+
+
+def test_serialize_data_unknown_backend():
+    """Test that an unknown backend is rejected."""
+    with pytest.raises(ValueError):
+        serialize_data({}, backend="missing")
+
+
+def test_serialize_data_to_text_stream():
+    """Test writing a document in chunks to a text stream."""
+    data = {"items": list(range(1000)), "name": "test"}
+    stream = io.StringIO()
+    written = serialize_data_to(data, stream, chunk_size=64)
+
+    assert stream.getvalue() == serialize_data(data)
+    assert written == len(stream.getvalue())
+
+
+@pytest.mark.parametrize("backend", available_serializers())
+def test_serialize_data_to_binary_stream(backend):
+    """Test writing a document to a binary stream with every backend."""
+    data = {"b": [1, 2], "a": "é"}
+    stream = io.BytesIO()
+    serialize_data_to(data, stream, backend=backend)
+
+    assert stream.getvalue() == serialize_data(data, backend=backend, as_bytes=True)
+
+
+def test_serialize_data_to_ndjson():
+    """Test writing records as newline-delimited JSON."""
+    records = ({"id": i} for i in range(3))
+    stream = io.BytesIO()
+    serialize_data_to(records, stream, ndjson=True)
+
+    assert stream.getvalue() == b'{"id": 0}\n{"id": 1}\n{"id": 2}\n'
+
+
+def test_serialize_data_to_socket():
+    """Test writing to an object that only has sendall, like a socket."""
+
+    class FakeSocket:
+        def __init__(self):
+            self.sent = []
+
+        def sendall(self, data):
+            self.sent.append(data)
+
+    sock = FakeSocket()
+    serialize_data_to([{"a": 1}], sock, ndjson=True)
+
+    assert b"".join(sock.sent) == b'{"a": 1}\n'
+
+
+def test_serialize_data_to_error():
+    """Test that encoding errors are raised rather than returned."""
+    with pytest.raises(TypeError):
+        serialize_data_to({"a": object()}, io.StringIO())
+
+
+def test_parse_version():
+    """Test parsing a version string into a comparable Version."""
+    version = parse_version("3.8.5")
+
+    assert version == Version(3, 8, 5)
+    assert (version.major, version.minor, version.micro) == (3, 8, 5)
+    assert str(version) == "3.8.5"
+    assert parse_version("3.8") == parse_version("3.8.0")
+
+
+def test_parse_version_ordering():
+    """Test that versions order numerically rather than lexically."""
+    assert parse_version("3.10") > parse_version("3.9")
+    assert parse_version("3.7.1") < parse_version("3.7.10")
+    assert sorted(parse_versions(["3.10", "3.7", "3.9.1"])) == [
+        Version(3, 7),
+        Version(3, 9, 1),
+        Version(3, 10),
+    ]
+    assert len({parse_version("3.8"), Version(3, 8, 0)}) == 1
+
+
+def test_parse_version_is_cached():
+    """Test that repeated parses of the same string hit the cache."""
+    parse_version.cache_clear()
+    parse_versions(["3.8.5", "3.8.5", "3.9"])
+
+    info = parse_version.cache_info()
+    assert info.hits == 1
+    assert info.misses == 2
+
+
+def test_parse_version_invalid():
+    """Test that malformed version strings are rejected."""
+    with pytest.raises(ValueError):
+        parse_version("three.eight")
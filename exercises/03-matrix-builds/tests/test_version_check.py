@@ -3,12 +3,14 @@ Tests for the version_check module.
 """
 
 import sys
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 from matrix_demo.version_check import (check_compatibility,
                                        get_compatibility_info,
-                                       get_platform_info, get_python_version)
+                                       get_platform_field, get_platform_info,
+                                       get_python_version,
+                                       refresh_platform_info)
 
 
 def test_get_python_version():
@@ -29,6 +31,49 @@ def test_get_platform_info():
     assert "processor" in info
 
 
+@pytest.fixture
+def fresh_platform_cache():
+    """Start and finish with an empty platform info cache."""
+    refresh_platform_info()
+    yield
+    refresh_platform_info()
+
+
+def test_get_platform_info_is_cached(fresh_platform_cache):
+    """Test that platform fields are computed once and reused."""
+    fields = {
+        "processor": MagicMock(return_value="cpu"),
+        "system": MagicMock(return_value="os"),
+    }
+    with patch("matrix_demo.version_check._PLATFORM_FIELDS", fields):
+        assert get_platform_info() == {"processor": "cpu", "system": "os"}
+        assert get_platform_info() == {"processor": "cpu", "system": "os"}
+        assert fields["processor"].call_count == 1
+        assert fields["system"].call_count == 1
+
+
+def test_get_platform_field_is_lazy(fresh_platform_cache):
+    """Test that only requested fields are computed."""
+    fields = {
+        "processor": MagicMock(return_value="cpu"),
+        "system": MagicMock(return_value="os"),
+    }
+    with patch("matrix_demo.version_check._PLATFORM_FIELDS", fields):
+        assert get_platform_field("system") == "os"
+        fields["processor"].assert_not_called()
+
+
+def test_refresh_platform_info(fresh_platform_cache):
+    """Test that refreshing recomputes the forgotten fields."""
+    system = MagicMock(side_effect=["old", "new"])
+    fields = {"system": system}
+    with patch.dict("matrix_demo.version_check._PLATFORM_FIELDS", fields):
+        assert get_platform_field("system") == "old"
+        assert get_platform_field("system") == "old"
+        refresh_platform_info("system")
+        assert get_platform_field("system") == "new"
+
+
 def test_check_compatibility():
     """Test that check_compatibility returns the expected results."""
     is_compatible, message = check_compatibility()
@@ -0,0 +1,12 @@
+"""
+Shared fixtures for the report generator and reader tests.
+"""
+
+import pytest
+from report_generator import ReportGenerator
+
+
+@pytest.fixture
+def report_generator(tmp_path):
+    """Create a report generator that uses a temporary directory."""
+    return ReportGenerator(output_dir=str(tmp_path))
@@ -4,24 +4,405 @@ Report Generator Module
 This module generates different types of reports for demonstrating GitHub Actions artifacts.
 """
 
+import contextlib
 import csv
 import datetime
+import gzip
+import hashlib
+import io
+import itertools
 import json
 import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Optional
+
 import numpy as np
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+_CSV_COMPRESSION_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+_PLOT_MARKERS = "*+ox#@%&"
+_EXECUTORS = {"thread": ThreadPoolExecutor, "process": ProcessPoolExecutor}
+_COLUMNAR_FORMATS = (".npy", ".npz", ".arrow", ".parquet")
+_MANIFEST_FILENAME = ".report_manifest.json"
+_manifest_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class ReportResult:
+    """Details of a written report, captured while it was being written.
+
+    A result can be used anywhere a path is expected.
+    """
+
+    path: str
+    size: int
+    created_at: str
+    checksum: Optional[str] = None
+    rows: Optional[int] = None
+    duration: Optional[float] = None
+
+    def __fspath__(self):
+        return self.path
+
+    def __str__(self):
+        return self.path
+
+    def to_dict(self):
+        """Return the result as a JSON-serializable dictionary."""
+        return asdict(self)
+
+    @classmethod
+    def from_path(cls, path):
+        """Build a result for an existing file with a single stat call."""
+        stat = os.stat(path)
+        return cls(
+            path=os.fspath(path),
+            size=stat.st_size,
+            created_at=datetime.datetime.fromtimestamp(stat.st_ctime).isoformat(),
+        )
+
+
+class _ChecksumWriter(io.RawIOBase):
+    """Binary file sink that counts and hashes every byte written."""
+
+    def __init__(self, filepath):
+        super().__init__()
+        self._file = open(filepath, "wb")
+        self._digest = hashlib.sha256()
+        self.size = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        written = self._file.write(data)
+        self._digest.update(data)
+        self.size += written
+        return written
+
+    def close(self):
+        if not self.closed:
+            self._file.close()
+        super().close()
+
+    @property
+    def checksum(self):
+        return self._digest.hexdigest()
+
+
+class _Unhashable(TypeError):
+    """Raised while fingerprinting input that has no stable encoding."""
+
+
+# Scalars encoded by type and repr, so 1, 1.0, True and "1" all differ.
+_SCALAR_TYPES = frozenset({type(None), bool, int, float, str})
+_PLAIN_CONTAINER_TYPES = frozenset({list, tuple, dict})
+_ENCODE_CHUNK_SIZE = 4096
+
+
+def _is_plain(items):
+    """Return whether repr(items) is a stable encoding of the sequence items.
+
+    That holds when every item is a scalar, or a list, tuple or dict holding
+    only scalars: the repr of those types spells out every type and value.
+    """
+    types = set(map(type, items))
+    if types <= _SCALAR_TYPES:
+        return True
+    if not types <= _PLAIN_CONTAINER_TYPES:
+        return False
+    cells = itertools.chain.from_iterable(
+        itertools.chain(item, item.values()) if type(item) is dict else item
+        for item in items
+    )
+    return set(map(type, cells)) <= _SCALAR_TYPES
+
+
+def _encode_column(column):
+    """Return (tag, buffer) encoding a column of scalars, or None.
+
+    Columns of floats, and of ints that fit in 64 bits, are packed as raw
+    machine values; other scalar columns fall back to their repr.
+    """
+    types = set(map(type, column))
+    if types == {float}:
+        return b"d", memoryview(np.array(column, dtype=np.float64))
+    if types == {int}:
+        try:
+            return b"q", memoryview(np.array(column, dtype=np.int64))
+        except OverflowError:
+            pass
+    if types <= _SCALAR_TYPES:
+        return b"r", repr(column).encode("utf-8", "surrogatepass")
+    return None
+
+
+def _encode_chunk(chunk, update):
+    """Feed a bulk encoding of a slice of a list or tuple to update.
+
+    Returns False, having fed nothing, if the items are not plain values;
+    the caller then encodes them one at a time. Tagging each bulk form keeps
+    it apart from the per-item form.
+    """
+    types = set(map(type, chunk))
+    if len(types) == 1 and types <= {list, tuple} and len(set(map(len, chunk))) == 1:
+        # Equally long rows of one type are encoded column by column.
+        columns = [_encode_column(column) for column in zip(*chunk)]
+        if None in columns:
+            return False
+        update(f"\2{types.pop().__name__}:{len(chunk)}x{len(columns)}:".encode())
+        for tag, buffer in columns:
+            update(tag)
+            update(buffer)
+        return True
+    if _is_plain(chunk):
+        update(b"\1" + repr(chunk).encode("utf-8", "surrogatepass"))
+        return True
+    return False
+
+
+def _encode(part, update):
+    """Feed a stable, type-tagged encoding of part to the callable update.
+
+    update receives bytes-like pieces as they are produced, so nothing is
+    held in memory beyond the piece being encoded.
+    """
+    if type(part) in _SCALAR_TYPES:
+        update(f"{type(part).__name__}:{part!r}\0".encode("utf-8", "surrogatepass"))
+    elif isinstance(part, (list, tuple)):
+        update(f"{type(part).__name__}:{len(part)}:".encode())
+        for start in range(0, len(part), _ENCODE_CHUNK_SIZE):
+            chunk = part[start : start + _ENCODE_CHUNK_SIZE]
+            if not _encode_chunk(chunk, update):
+                for item in chunk:
+                    _encode(item, update)
+    elif isinstance(part, dict):
+        # Insertion order is kept, since it is also the order written out.
+        update(f"dict:{len(part)}:".encode())
+        for name, value in part.items():
+            _encode(name, update)
+            _encode(value, update)
+    elif isinstance(part, np.ndarray):
+        update(f"ndarray:{part.dtype.str}:{part.shape}:".encode())
+        if part.dtype.hasobject:
+            for item in part.ravel():
+                _encode(item, update)
+        else:
+            flat = np.ascontiguousarray(part).reshape(-1)
+            update(memoryview(flat.view(np.uint8)))
+    elif isinstance(part, np.generic):
+        update(f"{part.dtype.str}:".encode())
+        update(memoryview(np.ascontiguousarray(part).view(np.uint8)))
+    elif part is None or isinstance(part, (str, int, float)):
+        update(f"{type(part).__name__}:{part!r}\0".encode("utf-8", "surrogatepass"))
+    else:
+        raise _Unhashable(type(part).__name__)
+
+
+def _fingerprint(*parts):
+    """Return a SHA-256 hex digest identifying the given report inputs.
+
+    Returns None if any part cannot be encoded reliably, in which case the
+    report should not be cached.
+    """
+    digest = hashlib.sha256()
+    try:
+        for part in parts:
+            _encode(part, digest.update)
+            digest.update(b"\0")
+    except _Unhashable:
+        return None
+    return digest.hexdigest()
+
+
+@contextlib.contextmanager
+def _open_report(filepath, compression=None, binary=False):
+    """Open filepath for text writing, optionally compressing on the fly.
+
+    With binary set, a buffered binary file is yielded instead of a text one
+    and compression is not supported. Yields (file, sink). Every byte that
+    reaches the disk passes through sink, so its size and checksum are known
+    once the block exits without re-reading or re-statting the file.
+    """
+    if compression == "zstd" and zstandard is None:
+        raise ImportError("zstd compression requires the zstandard package")
+
+    sink = _ChecksumWriter(filepath)
+    try:
+        if compression is None:
+            stream = io.BufferedWriter(sink)
+        elif compression == "gzip":
+            stream = gzip.GzipFile(mode="wb", fileobj=sink)
+        else:
+            stream = zstandard.ZstdCompressor().stream_writer(sink, closefd=False)
+        if binary:
+            with stream as f:
+                yield f, sink
+        else:
+            with io.TextIOWrapper(stream, encoding="utf-8", newline="") as f:
+                yield f, sink
+    finally:
+        sink.close()
+
+
+def _iter_chunks(rows, chunk_size):
+    """Yield lists of at most chunk_size rows from any iterable of rows."""
+    if isinstance(rows, np.ndarray) and rows.dtype.names:
+        # Convert one slice at a time so only a chunk of rows ever exists
+        # as Python objects.
+        for start in range(0, len(rows), chunk_size):
+            yield rows[start : start + chunk_size].tolist()
+        return
+
+    iterator = iter(rows)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _as_results(reports):
+    """Return ReportResult objects for a mix of results and plain paths."""
+    return [
+        report if isinstance(report, ReportResult) else ReportResult.from_path(report)
+        for report in reports
+    ]
+
+
+def _data_range(values):
+    """Return (min, max) of values, or (0, 0) when there are none."""
+    if values.size == 0:
+        return 0.0, 0.0
+    return float(values.min()), float(values.max())
+
+
+def _bin(values, low, high, bins):
+    """Map values in [low, high] onto integer bins 0..bins - 1."""
+    span = high - low
+    if span == 0:
+        return np.zeros(values.shape, dtype=int)
+    scaled = np.nan_to_num((values - low) / span * (bins - 1))
+    return np.clip(np.rint(scaled), 0, bins - 1).astype(int)
+
 
 class ReportGenerator:
     """A class that generates different types of reports."""
 
-    def __init__(self, output_dir="reports"):
-        """Initialize the report generator."""
+    def __init__(self, output_dir="reports", use_cache=False):
+        """Initialize the report generator.
+
+        With use_cache enabled, a manifest of input hashes is kept in
+        output_dir and a report whose inputs and parameters are unchanged is
+        reused instead of being written again.
+        """
         self.output_dir = output_dir
+        self.use_cache = use_cache
         os.makedirs(output_dir, exist_ok=True)
 
+    def _load_manifest(self):
+        """Return the cache manifest, or an empty one if there is none."""
+        try:
+            with open(os.path.join(self.output_dir, _MANIFEST_FILENAME)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _cached_result(self, filename, key):
+        """Return the recorded result if filename was generated from key.
+
+        The file's size and modification time must still match the manifest,
+        so a report overwritten since it was recorded is not reused. On a
+        miss the entry is dropped before the report is written again, so a
+        file left half-written by an error is never picked up later.
+        """
+        if not self.use_cache:
+            return None
+        filepath = os.path.join(self.output_dir, filename)
+        entry = self._load_manifest().get(filename)
+        if entry is None:
+            return None
+        if key is not None and entry.get("hash") == key and "result" in entry:
+            try:
+                stat = os.stat(filepath)
+            except OSError:
+                stat = None
+            if (
+                stat is not None
+                and stat.st_size == entry["result"].get("size")
+                and stat.st_mtime_ns == entry.get("mtime_ns")
+            ):
+                return ReportResult(path=filepath, **entry["result"])
+        self._update_manifest(filename, None)
+        return None
+
+    def _finish(self, filename, key, sink, start, rows=None):
+        """Build the result for a report that has just been written."""
+        result = ReportResult(
+            path=os.path.join(self.output_dir, filename),
+            size=sink.size,
+            created_at=datetime.datetime.now().isoformat(),
+            checksum=sink.checksum,
+            rows=rows,
+            duration=time.perf_counter() - start,
+        )
+        self._record(filename, key, result)
+        return result
+
+    def _record(self, filename, key, result):
+        """Record the input hash and result of a report in the manifest."""
+        if not self.use_cache:
+            return
+        entry = None
+        if key is not None:
+            details = result.to_dict()
+            del details["path"], details["duration"]
+            entry = {
+                "hash": key,
+                "mtime_ns": os.stat(result.path).st_mtime_ns,
+                "result": details,
+            }
+        self._update_manifest(filename, entry)
+
+    def _update_manifest(self, filename, entry):
+        """Set the manifest entry for filename, or remove it if entry is None."""
+        with _manifest_lock:
+            manifest = self._load_manifest()
+            if entry is None:
+                if filename not in manifest:
+                    return
+                del manifest[filename]
+            else:
+                manifest[filename] = entry
+            # Replace the manifest atomically so concurrent writers never
+            # leave a truncated file behind; at worst an entry is lost and
+            # that report is regenerated next time.
+            fd, temp_path = tempfile.mkstemp(dir=self.output_dir)
+            with os.fdopen(fd, "w") as f:
+                json.dump(manifest, f, indent=2, sort_keys=True)
+            os.replace(temp_path, os.path.join(self.output_dir, _MANIFEST_FILENAME))
+
     def generate_json_report(self, data, filename="report.json"):
         """Generate a JSON report."""
+        start = time.perf_counter()
         filepath = os.path.join(self.output_dir, filename)
+        key = _fingerprint("json", data) if self.use_cache else None
+        cached = self._cached_result(filename, key)
+        if cached is not None:
+            return cached
 
         # Add metadata to the report
         report_data = {
@@ -32,90 +413,303 @@ class ReportGenerator:
             "data": data,
         }
 
-        with open(filepath, "w") as f:
+        with _open_report(filepath) as (f, sink):
             json.dump(report_data, f, indent=2)
 
-        return filepath
+        rows = len(data) if isinstance(data, list) else None
+        return self._finish(filename, key, sink, start, rows)
+
+    def generate_json_stream_report(
+        self, records, filename="report.json", compact=False
+    ):
+        """Generate a JSON report by streaming records from an iterable.
 
-    def generate_csv_report(self, data, headers, filename="report.csv"):
-        """Generate a CSV report."""
+        Records are encoded and written one at a time, so memory use does not
+        grow with the size of the report. The output has the same metadata
+        envelope as generate_json_report, with the records as the data list.
+        """
+        start = time.perf_counter()
         filepath = os.path.join(self.output_dir, filename)
 
-        with open(filepath, "w", newline="") as f:
+        metadata = {
+            "generated_at": datetime.datetime.now().isoformat(),
+            "report_type": "json",
+        }
+
+        if compact:
+            separators = (",", ":")
+            head = '{"metadata":%s,"data":[' % json.dumps(
+                metadata, separators=separators
+            )
+            first, delimiter, tail = "", ",", "]}"
+        else:
+            separators = (", ", ": ")
+            head = '{\n  "metadata": %s,\n  "data": [' % json.dumps(
+                metadata, indent=2
+            ).replace("\n", "\n  ")
+            first, delimiter, tail = "\n    ", ",\n    ", "\n  ]\n}"
+
+        encoder = json.JSONEncoder(separators=separators)
+        rows = 0
+        with _open_report(filepath) as (f, sink):
+            f.write(head)
+            separator = first
+            for record in records:
+                f.write(separator)
+                separator = delimiter
+                for chunk in encoder.iterencode(record):
+                    f.write(chunk)
+                rows += 1
+            f.write(tail if rows else tail.lstrip())
+
+        # Streamed records cannot be hashed without consuming them.
+        return self._finish(filename, None, sink, start, rows)
+
+    def generate_csv_report(
+        self, data, headers, filename="report.csv", chunk_size=10000, compression=None
+    ):
+        """Generate a CSV report.
+
+        data may be any iterable of rows, including generators, database
+        cursors and NumPy structured arrays. Rows are written in chunks of
+        chunk_size so the full report never has to be held in memory.
+        compression may be "gzip" or "zstd" (requires the zstandard package);
+        the matching extension is appended to filename if missing.
+        """
+        start = time.perf_counter()
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        if compression is not None:
+            if compression not in _CSV_COMPRESSION_SUFFIXES:
+                raise ValueError(f"Unsupported compression: {compression}")
+            suffix = _CSV_COMPRESSION_SUFFIXES[compression]
+            if not filename.endswith(suffix):
+                filename += suffix
+        filepath = os.path.join(self.output_dir, filename)
+
+        # Only materialized data can be hashed without consuming it.
+        key = None
+        if self.use_cache and isinstance(data, (list, tuple, np.ndarray)):
+            key = _fingerprint("csv", headers, data)
+        cached = self._cached_result(filename, key)
+        if cached is not None:
+            return cached
+
+        rows = 0
+        with _open_report(filepath, compression) as (f, sink):
             writer = csv.writer(f)
             writer.writerow(headers)
-            writer.writerows(data)
+            for chunk in _iter_chunks(data, chunk_size):
+                writer.writerows(chunk)
+                rows += len(chunk)
 
-        return filepath
+        return self._finish(filename, key, sink, start, rows)
 
     def generate_plot_report(
-        self, x_data, y_data, title="Plot Report", filename="plot.txt"
+        self,
+        x_data,
+        y_data,
+        title="Plot Report",
+        filename="plot.txt",
+        width=60,
+        height=20,
+        labels=None,
     ):
-        """Generate a text-based plot report."""
+        """Generate a text-based plot report.
+
+        y_data is either one series or a sequence of series sharing x_data.
+        Points are binned into a width x height character grid in a single
+        vectorized pass per series, and the axis labels come from the data.
+        """
+        start = time.perf_counter()
+        if width < 1 or height < 1:
+            raise ValueError("width and height must be at least 1")
         filepath = os.path.join(self.output_dir, filename)
 
-        with open(filepath, "w") as f:
+        x = np.asarray(x_data, dtype=float).ravel()
+        y = np.atleast_2d(np.asarray(y_data, dtype=float))
+        if y.shape[1] != x.size:
+            raise ValueError("Every y series must have one value per x value")
+        if len(y) > len(_PLOT_MARKERS):
+            raise ValueError(f"At most {len(_PLOT_MARKERS)} series are supported")
+
+        key = None
+        if self.use_cache:
+            key = _fingerprint("plot", x, y, title, width, height, labels)
+        cached = self._cached_result(filename, key)
+        if cached is not None:
+            return cached
+
+        finite = np.isfinite(x) & np.isfinite(y)
+        x_min, x_max = _data_range(np.broadcast_to(x, y.shape)[finite])
+        y_min, y_max = _data_range(y[finite])
+
+        # Map each point to a column and a row; row 0 is the top of the plot.
+        columns = _bin(x, x_min, x_max, width)
+        rows = height - 1 - _bin(y, y_min, y_max, height)
+
+        grid = np.full((height, width), " ", dtype="U1")
+        for marker, series_rows, series_finite in zip(_PLOT_MARKERS, rows, finite):
+            grid[series_rows[series_finite], columns[series_finite]] = marker
+
+        with _open_report(filepath) as (f, sink):
             f.write(f"{title}\n")
             f.write("=" * len(title) + "\n\n")
-            
-            # Create a simple ASCII plot
-            height = 20
-            width = 60
-            y_range = max(abs(min(y_data)), abs(max(y_data)))
-            y_scale = height / (2 * y_range)
-            
-            for i in range(height, -1, -1):
-                line = []
-                for x, y in zip(x_data, y_data):
-                    if abs(y * y_scale - i) < 0.5:
-                        line.append("*")
-                    else:
-                        line.append(" ")
-                f.write("".join(line) + "\n")
-            
-            f.write("\nX-axis: 0 to 10\n")
-            f.write("Y-axis: -1 to 1\n")
-
-        return filepath
-
-    def generate_summary_report(self, reports, filename="summary.txt"):
-        """Generate a summary of all reports."""
+            f.write("\n".join("".join(row) for row in grid) + "\n")
+            f.write(f"\nX-axis: {x_min:g} to {x_max:g}\n")
+            f.write(f"Y-axis: {y_min:g} to {y_max:g}\n")
+            if labels is not None:
+                names = labels
+            elif len(y) > 1:
+                names = [f"Series {i + 1}" for i in range(len(y))]
+            else:
+                names = []
+            for marker, name in zip(_PLOT_MARKERS, names):
+                f.write(f"{marker} {name}\n")
+
+        return self._finish(filename, key, sink, start)
+
+    def generate_columnar_report(self, columns, filename="report.npy"):
+        """Generate a binary columnar report from a mapping of column arrays.
+
+        The format follows the extension of filename:
+
+        - ``.npy``: one NumPy structured array, which report_reader can
+          memory-map and expose as zero-copy column views.
+        - ``.npz``: one NumPy array per column in an uncompressed archive.
+        - ``.arrow`` / ``.parquet``: an Arrow IPC file or a Parquet file,
+          which require the pyarrow package.
+        """
+        start = time.perf_counter()
+        extension = os.path.splitext(filename)[1]
+        if extension not in _COLUMNAR_FORMATS:
+            raise ValueError(f"Unsupported columnar format: {extension}")
+        if extension in (".arrow", ".parquet") and pyarrow is None:
+            raise ImportError(f"{extension} reports require the pyarrow package")
         filepath = os.path.join(self.output_dir, filename)
 
-        with open(filepath, "w") as f:
+        arrays = {name: np.asarray(values) for name, values in columns.items()}
+        lengths = {len(array) for array in arrays.values()}
+        if len(lengths) > 1:
+            raise ValueError("All columns must have the same length")
+        for name, array in arrays.items():
+            if array.ndim != 1 or array.dtype.hasobject:
+                raise ValueError(f"Column {name!r} must be a 1-D non-object array")
+        rows = lengths.pop() if lengths else 0
+
+        key = None
+        if self.use_cache:
+            key = _fingerprint("columnar", list(arrays), *arrays.values())
+        cached = self._cached_result(filename, key)
+        if cached is not None:
+            return cached
+
+        with _open_report(filepath, binary=True) as (f, sink):
+            if extension == ".npy":
+                table = np.empty(
+                    rows, dtype=[(name, array.dtype) for name, array in arrays.items()]
+                )
+                for name, array in arrays.items():
+                    table[name] = array
+                np.save(f, table, allow_pickle=False)
+            elif extension == ".npz":
+                np.savez(f, **arrays)
+            else:
+                table = pyarrow.table(arrays)
+                if extension == ".arrow":
+                    with pyarrow.ipc.new_file(f, table.schema) as writer:
+                        writer.write_table(table)
+                else:
+                    import pyarrow.parquet as pq
+
+                    pq.write_table(table, f)
+
+        return self._finish(filename, key, sink, start, rows)
+
+    def generate_summary_report(
+        self, reports, filename="summary.txt", generated_at=None
+    ):
+        """Generate a summary of all reports.
+
+        reports may contain ReportResult objects, whose details were captured
+        while they were written, or plain paths, which are statted once each.
+        """
+        start = time.perf_counter()
+        filepath = os.path.join(self.output_dir, filename)
+        results = _as_results(reports)
+        generated_at = generated_at or datetime.datetime.now().isoformat()
+
+        with _open_report(filepath) as (f, sink):
             f.write("Report Generation Summary\n")
             f.write("=======================\n\n")
-            f.write(f"Generated at: {datetime.datetime.now().isoformat()}\n\n")
+            f.write(f"Generated at: {generated_at}\n\n")
 
-            for report in reports:
-                f.write(f"Report: {os.path.basename(report)}\n")
-                f.write(f"Size: {os.path.getsize(report)} bytes\n")
-                f.write(
-                    f"Created: {datetime.datetime.fromtimestamp(os.path.getctime(report)).isoformat()}\n"
-                )
+            for result in results:
+                f.write(f"Report: {os.path.basename(result.path)}\n")
+                f.write(f"Size: {result.size} bytes\n")
+                f.write(f"Created: {result.created_at}\n")
+                if result.rows is not None:
+                    f.write(f"Rows: {result.rows}\n")
+                if result.duration is not None:
+                    f.write(f"Duration: {result.duration:.6f} seconds\n")
+                if result.checksum is not None:
+                    f.write(f"SHA-256: {result.checksum}\n")
                 f.write("-" * 50 + "\n")
 
-        return filepath
+        return self._finish(filename, None, sink, start, len(results))
+
+    def generate_summary_json_report(
+        self, reports, filename="summary.json", generated_at=None
+    ):
+        """Generate a machine-readable JSON summary of all reports."""
+        start = time.perf_counter()
+        filepath = os.path.join(self.output_dir, filename)
+        results = _as_results(reports)
+        summary = {
+            "generated_at": generated_at or datetime.datetime.now().isoformat(),
+            "reports": [result.to_dict() for result in results],
+        }
+
+        with _open_report(filepath) as (f, sink):
+            json.dump(summary, f, indent=2)
 
-    def generate_all_reports(self):
-        """Generate all types of reports with sample data."""
-        reports = []
+        return self._finish(filename, None, sink, start, len(results))
 
-        # Generate JSON report
+    def generate_all_reports(self, executor=None, max_workers=None):
+        """Generate all types of reports with sample data.
+
+        executor selects how the independent reports are produced: None runs
+        them one after another, "thread" or "process" runs them concurrently
+        on a pool of max_workers. The summary is written once all of them
+        have finished.
+        """
+        # JSON report
         json_data = {
             "metrics": {"users": 1000, "active_users": 750, "conversion_rate": 0.25}
         }
-        reports.append(self.generate_json_report(json_data))
 
-        # Generate CSV report
+        # CSV report
         headers = ["ID", "Name", "Value"]
         data = [[1, "Item 1", 100], [2, "Item 2", 200], [3, "Item 3", 300]]
-        reports.append(self.generate_csv_report(data, headers))
 
-        # Generate plot report
+        # Plot report
         x = np.linspace(0, 10, 100)
         y = np.sin(x)
-        reports.append(self.generate_plot_report(x, y, "Sample Plot"))
+
+        tasks = [
+            (self.generate_json_report, (json_data,)),
+            (self.generate_csv_report, (data, headers)),
+            (self.generate_plot_report, (x, y, "Sample Plot")),
+        ]
+
+        if executor is None:
+            reports = [function(*args) for function, args in tasks]
+        elif executor in _EXECUTORS:
+            with _EXECUTORS[executor](max_workers=max_workers) as pool:
+                futures = [pool.submit(function, *args) for function, args in tasks]
+                reports = [future.result() for future in futures]
+        else:
+            raise ValueError(f"Unsupported executor: {executor}")
 
         # Generate summary report
         summary_report = self.generate_summary_report(reports)
@@ -0,0 +1,218 @@
+"""
+Report Reader Module
+
+This module reads back reports written by the report generator.
+"""
+
+import codecs
+import contextlib
+import csv
+import gzip
+import io
+import json
+import mmap
+import os
+import re
+
+import numpy as np
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+_WHITESPACE = re.compile(r"\s*")
+
+
+@contextlib.contextmanager
+def _open_binary(filepath):
+    """Yield a read-only binary view of a report file.
+
+    Plain files are memory-mapped, so their pages are only read as they are
+    reached; ``.gz`` and ``.zst`` files are decompressed as a stream. Either
+    way the view supports read() and readline().
+    """
+    extension = os.path.splitext(filepath)[1]
+    if extension == ".gz":
+        with gzip.open(filepath, "rb") as f:
+            yield f
+    elif extension == ".zst":
+        if zstandard is None:
+            raise ImportError("zstd reports require the zstandard package")
+        with open(filepath, "rb") as raw:
+            with io.BufferedReader(
+                zstandard.ZstdDecompressor().stream_reader(raw)
+            ) as f:
+                yield f
+    else:
+        with open(filepath, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                yield io.BytesIO()
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield mapped
+
+
+def _decode(chunks):
+    """Decode an iterable of UTF-8 byte chunks split at arbitrary points."""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    for chunk in chunks:
+        yield decoder.decode(chunk)
+    # Raises UnicodeDecodeError if the input ends inside a character.
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+class _JSONStream:
+    """Decode JSON values one at a time from an iterable of text chunks."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+
+    def _fill(self, size=1):
+        """Read chunks until size characters are unread or input runs out.
+
+        Returns False if nothing could be read.
+        """
+        pieces = [self._buffer[self._pos :]]
+        unread = len(pieces[0])
+        while unread < size or len(pieces) == 1:
+            chunk = next(self._chunks, "")
+            if not chunk:
+                break
+            pieces.append(chunk)
+            unread += len(chunk)
+        if len(pieces) == 1:
+            return False
+        self._buffer = "".join(pieces)
+        self._pos = 0
+        return True
+
+    def peek(self):
+        """Return the next non-whitespace character, or "" at end of input."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char):
+        """Consume char, which must be the next non-whitespace character."""
+        if self.peek() != char:
+            raise ValueError(f"Malformed JSON report: expected {char!r}")
+        self._pos += 1
+
+    def value(self):
+        """Decode and return the next complete JSON value.
+
+        Each failed attempt at least doubles the text available before the
+        next one, so a value spanning many chunks is decoded in linear time.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill(2 * (len(self._buffer) - self._pos)):
+                    raise
+                continue
+            # A number that ends exactly at the end of the buffer may carry
+            # on in the next chunk.
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+
+def iter_csv_rows(filepath, as_dict=False):
+    """Lazily iterate over the rows of a CSV report.
+
+    The header row is skipped. With as_dict set, each row is returned as a
+    dict keyed by the header instead of a list.
+    """
+    with _open_binary(os.fspath(filepath)) as source:
+        reader = csv.reader(_decode(iter(source.readline, b"")))
+        headers = next(reader, None)
+        if headers is None:
+            return
+        for row in reader:
+            yield dict(zip(headers, row)) if as_dict else row
+
+
+def iter_json_records(filepath, chunk_size=1 << 16):
+    """Lazily iterate over the records in the data list of a JSON report.
+
+    The report is decoded incrementally, chunk_size bytes at a time,
+    so only one record needs to be in memory at once. If data is not a list
+    it is yielded as a single record.
+    """
+    with _open_binary(os.fspath(filepath)) as source:
+        chunks = iter(lambda: source.read(chunk_size), b"")
+        stream = _JSONStream(_decode(chunks))
+        stream.expect("{")
+        while stream.peek() != "}":
+            key = stream.value()
+            stream.expect(":")
+            if key != "data":
+                stream.value()
+            elif stream.peek() != "[":
+                yield stream.value()
+                return
+            else:
+                stream.expect("[")
+                while stream.peek() != "]":
+                    yield stream.value()
+                    if stream.peek() == ",":
+                        stream.expect(",")
+                return
+            if stream.peek() == ",":
+                stream.expect(",")
+
+
+def read_columnar_report(filepath):
+    """Read a columnar report and return a dict of column arrays.
+
+    ``.npy`` reports are memory-mapped and each column is a zero-copy view
+    into the mapping, so only the pages that are actually touched are read.
+    ``.arrow`` reports are memory-mapped through pyarrow and converted
+    without copying where the column type allows it. ``.npz`` and
+    ``.parquet`` reports have to be decoded and are loaded per column.
+    """
+    filepath = os.fspath(filepath)
+    extension = os.path.splitext(filepath)[1]
+
+    if extension == ".npy":
+        table = np.load(filepath, mmap_mode="r", allow_pickle=False)
+        return {name: table[name] for name in table.dtype.names}
+
+    if extension == ".npz":
+        with np.load(filepath, allow_pickle=False) as archive:
+            return {name: archive[name] for name in archive.files}
+
+    if extension not in (".arrow", ".parquet"):
+        raise ValueError(f"Unsupported columnar format: {extension}")
+    if pyarrow is None:
+        raise ImportError(f"{extension} reports require the pyarrow package")
+
+    if extension == ".arrow":
+        with pyarrow.memory_map(filepath) as source:
+            table = pyarrow.ipc.open_file(source).read_all()
+    else:
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(filepath, memory_map=True)
+
+    return {
+        name: column.to_numpy()
+        for name, column in zip(table.column_names, table.columns)
+    }
@@ -3,20 +3,18 @@ Tests for the report generator module.
 """
 
 import csv
+import datetime
+import gzip
+import hashlib
 import json
 import os
+import time
 
 import numpy as np
 import pytest
 from report_generator import ReportGenerator
 
 
-@pytest.fixture
-def report_generator(tmp_path):
-    """Create a report generator that uses a temporary directory."""
-    return ReportGenerator(output_dir=str(tmp_path))
-
-
 def test_generate_json_report(report_generator):
     """Test generating a JSON report."""
     data = {"test": "data"}
@@ -31,6 +29,30 @@ def test_generate_json_report(report_generator):
     assert report_data["data"] == data
 
 
+def test_generate_json_stream_report(report_generator):
+    """Test streaming records from a generator into a JSON report."""
+    records = ({"id": i, "value": i * 10} for i in range(5))
+    filepath = report_generator.generate_json_stream_report(records)
+
+    with open(filepath) as f:
+        report_data = json.load(f)
+
+    assert report_data["metadata"]["report_type"] == "json"
+    assert report_data["data"] == [{"id": i, "value": i * 10} for i in range(5)]
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_generate_json_stream_report_empty(report_generator, compact):
+    """Test streaming an empty iterable in both output modes."""
+    filepath = report_generator.generate_json_stream_report(iter([]), compact=compact)
+
+    with open(filepath) as f:
+        content = f.read()
+
+    assert json.loads(content)["data"] == []
+    assert ("\n" not in content) is compact
+
+
 def test_generate_csv_report(report_generator):
     """Test generating a CSV report."""
     headers = ["ID", "Name"]
@@ -48,6 +70,45 @@ def test_generate_csv_report(report_generator):
         assert row == [str(x) for x in data[i]]
 
 
+def test_generate_csv_report_from_generator(report_generator):
+    """Test writing rows from a generator in several gzip-compressed chunks."""
+    rows = ([i, f"Item {i}"] for i in range(25))
+    filepath = report_generator.generate_csv_report(
+        rows, ["ID", "Name"], chunk_size=10, compression="gzip"
+    )
+
+    assert filepath.path.endswith("report.csv.gz")
+    with gzip.open(filepath, "rt", newline="") as f:
+        rows = list(csv.reader(f))
+
+    assert rows[0] == ["ID", "Name"]
+    assert rows[1:] == [[str(i), f"Item {i}"] for i in range(25)]
+
+
+def test_generate_csv_report_structured_array(report_generator):
+    """Test writing a NumPy structured array."""
+    data = np.array([(1, 2.5), (2, 3.5), (3, 4.5)], dtype=[("id", "i4"), ("v", "f8")])
+    filepath = report_generator.generate_csv_report(data, ["ID", "V"], chunk_size=2)
+
+    with open(filepath) as f:
+        rows = list(csv.reader(f))
+
+    assert rows == [["ID", "V"], ["1", "2.5"], ["2", "3.5"], ["3", "4.5"]]
+
+
+def test_generate_csv_report_invalid_compression(report_generator):
+    """Test that an unknown compression scheme is rejected."""
+    with pytest.raises(ValueError):
+        report_generator.generate_csv_report([], ["ID"], compression="rar")
+
+
+@pytest.mark.parametrize("chunk_size", [0, -1])
+def test_generate_csv_report_invalid_chunk_size(report_generator, chunk_size):
+    """Test that a chunk size below one is rejected."""
+    with pytest.raises(ValueError):
+        report_generator.generate_csv_report([[1]], ["ID"], chunk_size=chunk_size)
+
+
 def test_generate_plot_report(report_generator):
     """Test generating a plot report."""
     x = np.array([1, 2, 3])
@@ -55,10 +116,54 @@ def test_generate_plot_report(report_generator):
     filepath = report_generator.generate_plot_report(x, y)
 
     assert os.path.exists(filepath)
-    assert filepath.endswith(".png")
+    assert filepath.path.endswith(".txt")
     assert os.path.getsize(filepath) > 0
 
 
+def test_generate_plot_report_grid(report_generator):
+    """Test that the ASCII plot bins points into the requested grid."""
+    x = np.linspace(0, 10, 1000)
+    filepath = report_generator.generate_plot_report(
+        x, [np.sin(x), np.cos(x)], "Waves", width=40, height=10
+    )
+
+    with open(filepath) as f:
+        lines = f.read().splitlines()
+
+    grid = lines[3:13]
+    assert all(len(line) == 40 for line in grid)
+    assert any("*" in line for line in grid)
+    assert any("+" in line for line in grid)
+    assert "X-axis: 0 to 10" in lines
+    assert "* Series 1" in lines
+
+
+def test_generate_plot_report_mismatched_series(report_generator):
+    """Test that y series must match the length of x."""
+    with pytest.raises(ValueError):
+        report_generator.generate_plot_report([1, 2, 3], [1, 2])
+
+
+@pytest.mark.parametrize("size", [{"width": 0}, {"height": 0}, {"width": -5}])
+def test_generate_plot_report_invalid_size(report_generator, size):
+    """Test that a plot grid smaller than one cell is rejected."""
+    with pytest.raises(ValueError):
+        report_generator.generate_plot_report([1, 2], [3, 4], **size)
+
+
+def test_generate_plot_report_array_labels(report_generator):
+    """Test that series labels may be given as a NumPy array."""
+    filepath = report_generator.generate_plot_report(
+        [1, 2], [[3, 4], [5, 6]], labels=np.array(["up", "down"])
+    )
+
+    with open(filepath) as f:
+        lines = f.read().splitlines()
+
+    assert "* up" in lines
+    assert "+ down" in lines
+
+
 def test_generate_summary_report(report_generator):
     """Test generating a summary report."""
     # First create some reports to summarize
@@ -86,9 +191,193 @@ def test_generate_all_reports(report_generator):
     extensions = [os.path.splitext(report)[1] for report in reports]
     assert ".json" in extensions
     assert ".csv" in extensions
-    assert ".png" in extensions
     assert ".txt" in extensions
 
     for report in reports:
         assert os.path.exists(report)
         assert os.path.getsize(report) > 0
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_generate_all_reports_parallel(report_generator, executor):
+    """Test generating all reports concurrently."""
+    reports = report_generator.generate_all_reports(executor=executor, max_workers=3)
+
+    assert len(reports) == 4
+    assert reports[-1].path.endswith("summary.txt")
+    for report in reports[:-1]:
+        assert report.duration >= 0
+
+    with open(reports[-1]) as f:
+        assert f.read().count("Duration:") == 3
+
+
+def test_generate_all_reports_invalid_executor(report_generator):
+    """Test that an unknown executor is rejected."""
+    with pytest.raises(ValueError):
+        report_generator.generate_all_reports(executor="gpu")
+
+
+def test_cached_report_is_reused(tmp_path):
+    """Test that unchanged inputs skip regeneration when caching is enabled."""
+    generator = ReportGenerator(output_dir=str(tmp_path), use_cache=True)
+    filepath = generator.generate_json_report({"test": "data"})
+    assert filepath.duration is not None
+
+    cached = generator.generate_json_report({"test": "data"})
+    assert cached.path == filepath.path
+    assert cached.checksum == filepath.checksum
+    assert cached.duration is None
+
+    changed = generator.generate_json_report({"test": "changed"})
+    assert changed.duration is not None
+    with open(filepath) as f:
+        assert json.load(f)["data"] == {"test": "changed"}
+
+
+def test_cache_disabled_by_default(report_generator):
+    """Test that reports are always rewritten when caching is off."""
+    filepath = report_generator.generate_csv_report([[1]], ["ID"])
+    with open(filepath, "w") as f:
+        f.write("stale")
+
+    report_generator.generate_csv_report([[1]], ["ID"])
+    with open(filepath) as f:
+        assert f.read() != "stale"
+
+
+def test_cache_survives_new_generator(tmp_path):
+    """Test that the manifest in output_dir is shared across instances."""
+    x = np.linspace(0, 1, 10)
+    ReportGenerator(str(tmp_path), use_cache=True).generate_plot_report(x, x)
+
+    result = ReportGenerator(str(tmp_path), use_cache=True).generate_plot_report(x, x)
+    assert result.duration is None
+
+    result = ReportGenerator(str(tmp_path), use_cache=True).generate_plot_report(
+        x, x, width=30
+    )
+    assert result.duration is not None
+
+
+def test_cache_detects_overwritten_report(tmp_path):
+    """Test that a report rewritten outside the cache is not reused."""
+    ReportGenerator(str(tmp_path), use_cache=True).generate_json_report({"v": 1})
+    ReportGenerator(str(tmp_path)).generate_json_report({"v": 2})
+
+    result = ReportGenerator(str(tmp_path), use_cache=True).generate_json_report(
+        {"v": 1}
+    )
+    assert result.duration is not None
+    with open(result) as f:
+        assert json.load(f)["data"] == {"v": 1}
+
+
+def test_cache_drops_entry_before_rewriting(tmp_path):
+    """Test that a report that fails half-way is never reused."""
+    generator = ReportGenerator(str(tmp_path), use_cache=True)
+    generator.generate_json_report({"v": 1})
+
+    with pytest.raises(TypeError):
+        generator.generate_json_report({"v": object()})
+    with open(tmp_path / ".report_manifest.json") as f:
+        assert "report.json" not in json.load(f)
+
+    assert generator.generate_json_report({"v": 1}).duration is not None
+
+
+def test_cache_hashes_nested_arrays_by_content(tmp_path):
+    """Test that large arrays inside rows are hashed by their full contents."""
+    generator = ReportGenerator(str(tmp_path), use_cache=True)
+    first = np.zeros(3000)
+    second = first.copy()
+    second[1500] = 1
+
+    generator.generate_csv_report([[first]], ["values"])
+    result = generator.generate_csv_report([[second]], ["values"])
+    assert result.duration is not None
+
+
+def test_cache_handles_awkward_inputs(tmp_path):
+    """Test mixed-type keys and values that have no stable encoding."""
+    generator = ReportGenerator(str(tmp_path), use_cache=True)
+    data = {1: "a", "b": 2}
+    generator.generate_json_report(data)
+    assert generator.generate_json_report(data).duration is None
+
+    # Dates have no stable encoding, so these reports are never cached.
+    rows = [[datetime.date(2024, 1, 1)]]
+    generator.generate_csv_report(rows, ["When"])
+    assert generator.generate_csv_report(rows, ["When"]).duration is not None
+
+
+@pytest.mark.parametrize(
+    "first, second",
+    [
+        ([[1, "a"]], [[1.0, "a"]]),
+        ([[1, "a"]], [[True, "a"]]),
+        ([[1, "a"]], [["1", "a"]]),
+        ([[0.0, "a"]], [[-0.0, "a"]]),
+        ([[2**63, "a"]], [[2**63 + 1, "a"]]),
+        ([[1, "a"], [2, "b"]], [(1, "a"), (2, "b")]),
+        ([[1, "a"], [2]], [[1, "a", 2]]),
+    ],
+)
+def test_cache_distinguishes_row_values(tmp_path, first, second):
+    """Test that rows hashed in bulk still differ by every type and value."""
+    generator = ReportGenerator(str(tmp_path), use_cache=True)
+    generator.generate_csv_report(first, ["A", "B"])
+    assert generator.generate_csv_report(second, ["A", "B"]).duration is not None
+    assert generator.generate_csv_report(second, ["A", "B"]).duration is None
+
+
+def test_cache_hit_is_cheaper_than_generating(tmp_path):
+    """Test that reusing a large cached report beats writing it again."""
+    rows = [[i, f"name{i}", i * 1.5] for i in range(100_000)]
+    generator = ReportGenerator(str(tmp_path), use_cache=True)
+    generator.generate_csv_report(rows, ["ID", "Name", "Value"])
+    uncached = ReportGenerator(str(tmp_path / "uncached"))
+
+    generating = min(
+        uncached.generate_csv_report(rows, ["ID", "Name", "Value"]).duration
+        for _ in range(3)
+    )
+    hits = []
+    for _ in range(3):
+        start = time.perf_counter()
+        assert (
+            generator.generate_csv_report(rows, ["ID", "Name", "Value"]).duration
+            is None
+        )
+        hits.append(time.perf_counter() - start)
+    assert min(hits) < generating
+
+
+def test_report_result_captured_at_write_time(report_generator):
+    """Test that generators report size, rows and checksum of what they wrote."""
+    result = report_generator.generate_csv_report([[1, "a"], [2, "b"]], ["ID", "Name"])
+
+    with open(result, "rb") as f:
+        content = f.read()
+
+    assert result.size == len(content) == os.path.getsize(result)
+    assert result.checksum == hashlib.sha256(content).hexdigest()
+    assert result.rows == 2
+    assert result.duration >= 0
+    assert str(result) == result.path
+
+
+def test_generate_summary_json_report(report_generator):
+    """Test the machine-readable summary built from results and plain paths."""
+    json_result = report_generator.generate_json_report([{"a": 1}, {"a": 2}])
+    csv_path = os.fspath(report_generator.generate_csv_report([[1]], ["ID"]))
+
+    summary = report_generator.generate_summary_json_report([json_result, csv_path])
+    with open(summary) as f:
+        data = json.load(f)
+
+    assert [entry["path"] for entry in data["reports"]] == [json_result.path, csv_path]
+    assert data["reports"][0] == json_result.to_dict()
+    assert data["reports"][0]["rows"] == 2
+    assert data["reports"][1]["size"] == os.path.getsize(csv_path)
+    assert data["reports"][1]["checksum"] is None
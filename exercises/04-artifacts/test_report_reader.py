@@ -0,0 +1,139 @@
+"""
+Tests for the report reader module.
+"""
+
+import json
+
+import numpy as np
+import pytest
+from report_reader import iter_csv_rows, iter_json_records, read_columnar_report
+
+
+@pytest.fixture
+def columns():
+    """Sample numeric and string columns."""
+    return {
+        "id": np.arange(5, dtype=np.int64),
+        "value": np.linspace(0, 1, 5),
+        "name": np.array(["a", "b", "c", "d", "e"]),
+    }
+
+
+@pytest.mark.parametrize("filename", ["report.npy", "report.npz"])
+def test_columnar_round_trip(report_generator, columns, filename):
+    """Test writing and reading back NumPy columnar reports."""
+    result = report_generator.generate_columnar_report(columns, filename)
+    assert result.rows == 5
+
+    loaded = read_columnar_report(result)
+
+    assert list(loaded) == list(columns)
+    for name, values in columns.items():
+        np.testing.assert_array_equal(loaded[name], values)
+
+
+def test_npy_columns_are_memory_mapped(report_generator, columns):
+    """Test that .npy columns are views into a memory mapping."""
+    result = report_generator.generate_columnar_report(columns)
+    loaded = read_columnar_report(result)
+
+    assert isinstance(loaded["value"], np.memmap)
+    assert not loaded["value"].flags.writeable
+
+
+@pytest.mark.parametrize("filename", ["report.arrow", "report.parquet"])
+def test_arrow_round_trip(report_generator, columns, filename):
+    """Test writing and reading back Arrow and Parquet reports."""
+    pytest.importorskip("pyarrow")
+    result = report_generator.generate_columnar_report(columns, filename)
+    loaded = read_columnar_report(result)
+
+    for name, values in columns.items():
+        assert list(loaded[name]) == list(values)
+
+
+def test_columnar_report_validation(report_generator):
+    """Test that mismatched, object and unknown-format columns are rejected."""
+    with pytest.raises(ValueError):
+        report_generator.generate_columnar_report({"a": [1, 2], "b": [1]})
+    with pytest.raises(ValueError):
+        report_generator.generate_columnar_report({"a": np.array([{}, {}])})
+    with pytest.raises(ValueError):
+        report_generator.generate_columnar_report({"a": [1]}, "report.xlsx")
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_iter_json_records(report_generator, compact):
+    """Test lazily reading records back from a streamed JSON report."""
+    records = [{"id": i, "name": "é" * i, "values": [i, i / 2]} for i in range(200)]
+    result = report_generator.generate_json_stream_report(
+        iter(records), compact=compact
+    )
+
+    # A tiny chunk size forces values and UTF-8 characters across chunk borders.
+    assert list(iter_json_records(result, chunk_size=5)) == records
+
+
+def test_iter_json_records_non_list_data(report_generator):
+    """Test that non-list data is yielded as a single record."""
+    result = report_generator.generate_json_report({"test": "data"})
+
+    assert list(iter_json_records(result)) == [{"test": "data"}]
+
+
+def test_iter_json_records_large_value_in_linear_time(report_generator, monkeypatch):
+    """Test that a value spanning many chunks is not re-decoded per chunk."""
+    data = {f"key{i}": "x" * 100 for i in range(10000)}
+    result = report_generator.generate_json_report(data)
+
+    attempts = []
+    raw_decode = json.JSONDecoder.raw_decode
+
+    def counting_raw_decode(self, s, idx=0):
+        attempts.append(idx)
+        return raw_decode(self, s, idx)
+
+    monkeypatch.setattr(json.JSONDecoder, "raw_decode", counting_raw_decode)
+    assert list(iter_json_records(result, chunk_size=1024)) == [data]
+    # About 1100 chunks; doubling the text per attempt needs only a few dozen.
+    assert len(attempts) < 50
+
+
+def test_iter_json_records_is_lazy(report_generator):
+    """Test that records are produced before the whole report is read."""
+    result = report_generator.generate_json_stream_report(
+        ({"id": i} for i in range(10000)), compact=True
+    )
+
+    records = iter_json_records(result, chunk_size=64)
+    assert next(records) == {"id": 0}
+    records.close()
+
+
+@pytest.mark.parametrize("compression", [None, "gzip"])
+def test_iter_csv_rows(report_generator, compression):
+    """Test lazily reading rows back from plain and compressed CSV reports."""
+    data = [[1, "Item 1"], [2, "multi\nline"]]
+    result = report_generator.generate_csv_report(
+        data, ["ID", "Name"], compression=compression
+    )
+
+    assert list(iter_csv_rows(result)) == [["1", "Item 1"], ["2", "multi\nline"]]
+    assert next(iter_csv_rows(result, as_dict=True)) == {"ID": "1", "Name": "Item 1"}
+
+
+def test_iter_csv_rows_truncated_utf8(tmp_path):
+    """Test that a report cut off inside a character is not silently read."""
+    filepath = tmp_path / "truncated.csv"
+    filepath.write_bytes("ID\n1\né".encode()[:-1])
+
+    with pytest.raises(UnicodeDecodeError):
+        list(iter_csv_rows(filepath))
+
+
+def test_iter_csv_rows_empty_file(tmp_path):
+    """Test that an empty file yields no rows."""
+    path = tmp_path / "empty.csv"
+    path.write_text("")
+
+    assert list(iter_csv_rows(path)) == []
@@ -2,10 +2,16 @@
 Simple Flask web application for demonstrating GitHub Actions deployments.
 """
 
+import hashlib
 import os
+import time
 
 from config import config
-from flask import Flask, jsonify
+from db import Database
+from flask import Flask, g, jsonify, request
+from health import HealthMonitor, database_probe
+from metrics import RequestMetrics
+from sqlalchemy.exc import SQLAlchemyError
 
 # Create Flask app
 app = Flask(__name__)
@@ -14,39 +20,130 @@ app = Flask(__name__)
 env = os.getenv("FLASK_ENV", "development")
 app.config.from_object(config[env])
 
+# Pooled database connections, opened on first use in each worker.
+database = Database.from_config(app.config)
 
-@app.route("/")
-def index():
-    """Return basic information about the application."""
-    return jsonify(
+# Dependencies are probed on a background thread; /ready serves the last result.
+# The thread starts with the first /ready request, or is started by serve.py,
+# which under a preforking server probes from the master only.
+health_monitor = HealthMonitor(interval=app.config["HEALTH_CHECK_INTERVAL"])
+health_monitor.add_probe(
+    "database",
+    database_probe(app.config["DATABASE_URL"], app.config["HEALTH_CHECK_TIMEOUT"]),
+)
+
+# Request metrics. When disabled, no hooks are registered at all, so
+# requests pay nothing for them.
+request_metrics = None
+if app.config["METRICS_ENABLED"]:
+    request_metrics = RequestMetrics()
+
+    @app.before_request
+    def _start_request_timer():
+        g.request_start = time.perf_counter()
+
+    @app.after_request
+    def _record_request_metrics(response):
+        start = g.pop("request_start", None)
+        if start is not None:
+            route = request.url_rule.rule if request.url_rule else "<unmatched>"
+            request_metrics.observe(
+                route,
+                request.method,
+                response.status_code,
+                time.perf_counter() - start,
+            )
+        return response
+
+    @app.route("/metrics")
+    def metrics():
+        """Return request metrics in Prometheus text format."""
+        return app.response_class(
+            request_metrics.render(), mimetype="text/plain; version=0.0.4"
+        )
+
+
+def _prebuild_json(payload):
+    """Serialize payload once, exactly as jsonify would, with its ETag."""
+    body = app.json.response(payload).get_data()
+    return body, hashlib.sha1(body).hexdigest()
+
+
+# The static endpoints only depend on configuration loaded at startup, so
+# their bodies are serialized once here rather than on every request.
+_STATIC_RESPONSES = {
+    "index": _prebuild_json(
         {
             "status": "ok",
             "environment": app.config["ENV"],
             "debug": app.config["DEBUG"],
             "version": app.config["VERSION"],
         }
-    )
+    ),
+    "health": _prebuild_json({"status": "healthy", "environment": app.config["ENV"]}),
+    "config": _prebuild_json(
+        {
+            "env": app.config["ENV"],
+            "debug": app.config["DEBUG"],
+            "version": app.config["VERSION"],
+            "database": app.config["DATABASE_URL"].split("@")[0] + "@******",
+        }
+    ),
+}
+
+
+def _static_response(name):
+    """Serve a prebuilt body, or 304 Not Modified if the client has it."""
+    body, etag = _STATIC_RESPONSES[name]
+    # If-None-Match uses weak comparison, so W/"<etag>" matches as well.
+    if request.if_none_match.contains_weak(etag):
+        response = app.response_class(status=304)
+    else:
+        response = app.response_class(body, mimetype="application/json")
+    response.set_etag(etag)
+    return response
+
+
+@app.route("/")
+def index():
+    """Return basic information about the application."""
+    return _static_response("index")
 
 
 @app.route("/health")
 def health():
     """Return health check status."""
-    return jsonify({"status": "healthy", "environment": app.config["ENV"]})
+    return _static_response("health")
+
+
+@app.route("/ready")
+def ready():
+    """Return the cached readiness of the application's dependencies."""
+    snapshot = health_monitor.snapshot()
+    return jsonify(snapshot), 200 if snapshot["status"] == "ready" else 503
+
+
+@app.route("/db")
+def db_check():
+    """Run a query through the connection pool and report its usage."""
+    try:
+        result = database.ping()
+    except SQLAlchemyError as e:
+        return jsonify({"status": "error", "error": type(e).__name__}), 503
+    return jsonify({"status": "ok", "result": result, "pool": database.pool_status()})
 
 
 @app.route("/config")
 def get_config():
     """Return non-sensitive configuration information."""
-    return jsonify(
-        {
-            "env": app.config["ENV"],
-            "debug": app.config["DEBUG"],
-            "version": app.config["VERSION"],
-            "database": app.config["DATABASE_URL"].split("@")[0] + "@******",
-        }
-    )
+    return _static_response("config")
 
 
 if __name__ == "__main__":
-    port = int(os.getenv("PORT", 5000))
-    app.run(host="0.0.0.0", port=port)
+    if app.config["DEBUG"]:
+        port = int(os.getenv("PORT", 5000))
+        app.run(host="0.0.0.0", port=port)
+    else:
+        from serve import serve
+
+        serve(app, app.config, health_monitor, request_metrics)
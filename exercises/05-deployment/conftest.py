@@ -0,0 +1,10 @@
+"""
+Shared test setup for the deployment application.
+"""
+
+import os
+
+# Configuration is read when app is imported, so select the testing
+# environment and an in-memory database before any test module imports it.
+os.environ.setdefault("FLASK_ENV", "testing")
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
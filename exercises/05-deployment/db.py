@@ -0,0 +1,104 @@
+"""
+Pooled database access for the deployment application.
+"""
+
+import os
+import threading
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
+
+
+class Database:
+    """A lazily created, pooled SQLAlchemy engine for one database URL.
+
+    The engine is built on first use rather than at import, so a preforking
+    server's master never opens connections. A worker that inherits an
+    engine from its parent drops the parent's pooled connections without
+    closing them and starts a fresh pool of its own.
+    """
+
+    def __init__(
+        self,
+        url,
+        pool_size=5,
+        max_overflow=10,
+        pool_recycle=1800,
+        pool_pre_ping=True,
+        pool_timeout=30,
+    ):
+        self.url = url
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.pool_recycle = pool_recycle
+        self.pool_pre_ping = pool_pre_ping
+        self.pool_timeout = pool_timeout
+        self._engine = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, settings):
+        """Create a Database from the DATABASE_* settings of a Flask config."""
+        return cls(
+            settings["DATABASE_URL"],
+            pool_size=settings["DATABASE_POOL_SIZE"],
+            max_overflow=settings["DATABASE_MAX_OVERFLOW"],
+            pool_recycle=settings["DATABASE_POOL_RECYCLE"],
+            pool_pre_ping=settings["DATABASE_POOL_PRE_PING"],
+            pool_timeout=settings["DATABASE_POOL_TIMEOUT"],
+        )
+
+    def _create_engine(self):
+        url = make_url(self.url)
+        options = {
+            "pool_recycle": self.pool_recycle,
+            "pool_pre_ping": self.pool_pre_ping,
+        }
+        # In-memory SQLite lives in a single connection, so it has no
+        # pool to size.
+        in_memory = url.database in (None, "", ":memory:")
+        if not (url.get_backend_name() == "sqlite" and in_memory):
+            options.update(
+                pool_size=self.pool_size,
+                max_overflow=self.max_overflow,
+                pool_timeout=self.pool_timeout,
+            )
+        return create_engine(url, **options)
+
+    @property
+    def engine(self):
+        """The engine for this process, created on first use."""
+        pid = os.getpid()
+        if self._engine is None or self._pid != pid:
+            with self._lock:
+                if self._engine is None:
+                    self._engine = self._create_engine()
+                elif self._pid != pid:
+                    self._engine.dispose(close=False)
+                self._pid = pid
+        return self._engine
+
+    def connect(self):
+        """Check a connection out of the pool; use it as a context manager."""
+        return self.engine.connect()
+
+    def ping(self):
+        """Run a trivial query and return its result."""
+        with self.connect() as connection:
+            return connection.execute(text("SELECT 1")).scalar()
+
+    def pool_status(self):
+        """Return a snapshot of the connection pool's usage."""
+        pool = self.engine.pool
+        status = {"class": type(pool).__name__}
+        for name in ("size", "checkedin", "checkedout", "overflow"):
+            counter = getattr(pool, name, None)
+            if callable(counter):
+                status[name] = counter()
+        return status
+
+    def dispose(self):
+        """Close every pooled connection."""
+        if self._engine is not None:
+            self._engine.dispose()
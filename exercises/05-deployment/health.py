@@ -0,0 +1,171 @@
+"""
+Background health probes for the deployment application.
+"""
+
+import datetime
+import json
+import os
+import socket
+import sqlite3
+import tempfile
+import threading
+import time
+from urllib.parse import quote
+
+from sqlalchemy.engine import make_url
+
+# Default ports for database URL schemes probed over TCP.
+_DEFAULT_PORTS = {"postgresql": 5432, "postgres": 5432, "mysql": 3306}
+
+
+def database_probe(database_url, timeout=2.0):
+    """Return a probe that checks the database behind database_url.
+
+    SQLite databases are opened and queried; a missing database file is
+    reported as a failure rather than created. Other databases are checked
+    by opening a TCP connection to their host and port.
+    """
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+
+    if backend == "sqlite":
+        if url.database in (None, "", ":memory:"):
+            target, uri = ":memory:", False
+        else:
+            target, uri = f"file:{quote(url.database)}?mode=rw", True
+
+        def probe():
+            connection = sqlite3.connect(target, timeout=timeout, uri=uri)
+            try:
+                connection.execute("SELECT 1")
+            finally:
+                connection.close()
+
+    else:
+        address = (url.host, url.port or _DEFAULT_PORTS.get(backend))
+
+        def probe():
+            socket.create_connection(address, timeout=timeout).close()
+
+    return probe
+
+
+class HealthMonitor:
+    """Run dependency probes on a background thread and cache the results.
+
+    Probes are callables that raise on failure. Readers only ever see the
+    last cached results, so serving them adds no latency and no load to
+    the dependencies, however often they are requested.
+
+    On its own, the monitor starts probing in whichever process first asks
+    for a snapshot. With state_path set, the results are shared through
+    that file instead: only the process that calls start() probes, and any
+    other process, such as a server's forked workers, reads the file.
+    """
+
+    def __init__(self, interval=30.0, state_path=None):
+        self.interval = interval
+        self.state_path = state_path
+        self.probes = {}
+        self._checks = {}
+        self._checked_at = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._pid = None
+        self._loaded = (None, {}, None)
+
+    def add_probe(self, name, probe):
+        """Register a probe to run on every refresh."""
+        self.probes[name] = probe
+
+    def start(self):
+        """Start the background refresher unless it runs in this process.
+
+        Threads do not survive a fork, so a worker forked from a process
+        that started the monitor starts its own refresher.
+        """
+        with self._lock:
+            if self._pid == os.getpid() and self._thread.is_alive():
+                return
+            self._pid = os.getpid()
+            self._stop = threading.Event()
+            self._thread = threading.Thread(
+                target=self._run,
+                args=(self._stop,),
+                name="health-monitor",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def stop(self):
+        """Stop the background refresher."""
+        self._stop.set()
+
+    def _run(self, stop):
+        while not stop.is_set():
+            self.refresh()
+            stop.wait(self.interval)
+
+    def refresh(self):
+        """Run every probe once and cache the results."""
+        checks = {}
+        for name, probe in list(self.probes.items()):
+            start = time.perf_counter()
+            try:
+                probe()
+            except Exception as e:
+                checks[name] = {"status": "error", "error": str(e)}
+            else:
+                checks[name] = {"status": "ok"}
+            checks[name]["latency_ms"] = round((time.perf_counter() - start) * 1000, 3)
+
+        with self._lock:
+            self._checks = checks
+            self._checked_at = time.time()
+        if self.state_path is not None:
+            self._publish(checks, self._checked_at)
+
+    def _publish(self, checks, checked_at):
+        """Atomically replace the shared state file with the results."""
+        directory = os.path.dirname(os.path.abspath(self.state_path))
+        fd, temp_path = tempfile.mkstemp(dir=directory)
+        with os.fdopen(fd, "w") as f:
+            json.dump({"checks": checks, "checked_at": checked_at}, f)
+        os.replace(temp_path, self.state_path)
+
+    def _read_shared(self):
+        """Return the results published by the probing process."""
+        try:
+            # The file is replaced on every refresh, so a new inode or
+            # modification time means new results.
+            stat = os.stat(self.state_path)
+            version = (stat.st_ino, stat.st_mtime_ns)
+            if version != self._loaded[0]:
+                with open(self.state_path) as f:
+                    state = json.load(f)
+                self._loaded = (version, state["checks"], state["checked_at"])
+        except (OSError, ValueError, KeyError):
+            return {}, None
+        return self._loaded[1], self._loaded[2]
+
+    def snapshot(self):
+        """Return the last cached results and their age in seconds."""
+        if self.state_path is None:
+            self.start()
+        if self.state_path is None or self._pid == os.getpid():
+            with self._lock:
+                checks, checked_at = self._checks, self._checked_at
+        else:
+            checks, checked_at = self._read_shared()
+
+        if checked_at is None:
+            return {"status": "pending", "age_seconds": None, "checks": {}}
+
+        ready = all(check["status"] == "ok" for check in checks.values())
+        return {
+            "status": "ready" if ready else "unavailable",
+            "checked_at": datetime.datetime.fromtimestamp(checked_at).isoformat(),
+            "age_seconds": round(time.time() - checked_at, 3),
+            "checks": checks,
+        }
@@ -0,0 +1,220 @@
+"""
+Request metrics for the deployment application, in Prometheus text format.
+"""
+
+import atexit
+import glob
+import json
+import os
+import tempfile
+import threading
+import time
+import weakref
+from bisect import bisect_left
+
+# Latency histogram bucket bounds in seconds (the Prometheus defaults).
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+# Every RequestMetrics, so a forked child can reset them all. Held weakly, so
+# the fork hook does not keep instances alive.
+_instances = weakref.WeakSet()
+
+
+def _reset_after_fork():
+    for metrics in list(_instances):
+        metrics._reset()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def _new_shard():
+    return {"requests": {}, "latency": {}}
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class RequestMetrics:
+    """Per-route request counts and latency histograms.
+
+    Each thread records into its own shard, so recording a request takes no
+    lock. Shards are only combined when the metrics are rendered, and the
+    shards of finished threads are folded into a shared total so
+    thread-per-request servers do not accumulate them.
+
+    With shared_dir set, every process also writes its totals to a file
+    there, at most publish_interval seconds out of date, and render() sums
+    the files of all processes. Files of exited processes are kept, so
+    counters from a multi-worker server never go backwards. A forked child
+    starts counting from zero, since its parent's counts are in the
+    parent's file.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS, shared_dir=None, publish_interval=1.0):
+        self.buckets = tuple(sorted(buckets))
+        self.shared_dir = shared_dir
+        self.publish_interval = publish_interval
+        self._lock = threading.Lock()
+        self._reset()
+        _instances.add(self)
+
+    def _reset(self):
+        """Forget every count; used in a freshly forked child."""
+        self._local = threading.local()
+        self._shards = []
+        self._retired = _new_shard()
+        self._lock = threading.Lock()
+        self._publisher_pid = None
+        self._published = None
+
+    def _shard(self):
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = _new_shard()
+            with self._lock:
+                self._shards.append((threading.current_thread(), shard))
+                if len(self._shards) > 64:
+                    self._retire_finished()
+                if self.shared_dir is not None and self._publisher_pid is None:
+                    self._start_publisher()
+            return shard
+
+    def _start_publisher(self):
+        """Publish this process's totals in the background from now on."""
+        self._publisher_pid = os.getpid()
+        atexit.register(self.publish)
+        threading.Thread(
+            target=self._publish_periodically, name="metrics-publisher", daemon=True
+        ).start()
+
+    def _publish_periodically(self):
+        pid = os.getpid()
+        while self._publisher_pid == pid:
+            time.sleep(self.publish_interval)
+            self.publish()
+
+    def _retire_finished(self):
+        """Fold the shards of finished threads into the retired total."""
+        live = []
+        for thread, shard in self._shards:
+            if thread.is_alive():
+                live.append((thread, shard))
+            else:
+                self._merge(self._retired, shard)
+        self._shards = live
+
+    def _merge(self, total, shard):
+        for key, count in dict(shard["requests"]).items():
+            total["requests"][key] = total["requests"].get(key, 0) + count
+        for route, histogram in dict(shard["latency"]).items():
+            histogram = list(histogram)
+            current = total["latency"].setdefault(route, [0] * len(histogram))
+            for i, value in enumerate(histogram):
+                current[i] += value
+
+    def observe(self, route, method, status, seconds):
+        """Record one request and how long it took."""
+        shard = self._shard()
+        requests = shard["requests"]
+        key = (route, method, status)
+        requests[key] = requests.get(key, 0) + 1
+
+        histogram = shard["latency"].get(route)
+        if histogram is None:
+            # One counter per bucket plus +Inf, followed by the sum.
+            histogram = shard["latency"][route] = [0] * (len(self.buckets) + 1) + [0.0]
+        histogram[bisect_left(self.buckets, seconds)] += 1
+        histogram[-1] += seconds
+
+    def _totals(self):
+        """Return the combined counts of every thread in this process."""
+        with self._lock:
+            self._retire_finished()
+            total = _new_shard()
+            self._merge(total, self._retired)
+            for _, shard in self._shards:
+                self._merge(total, shard)
+        return total
+
+    def publish(self):
+        """Write this process's totals to its file in shared_dir."""
+        if self.shared_dir is None:
+            return
+        total = self._totals()
+        state = json.dumps(
+            {
+                "requests": [[*key, count] for key, count in total["requests"].items()],
+                "latency": total["latency"],
+            }
+        )
+        if state == self._published:
+            return
+        fd, temp_path = tempfile.mkstemp(dir=self.shared_dir)
+        with os.fdopen(fd, "w") as f:
+            f.write(state)
+        os.replace(temp_path, os.path.join(self.shared_dir, f"{os.getpid()}.json"))
+        self._published = state
+
+    def _shared_totals(self):
+        """Return the combined counts published by every process."""
+        self.publish()
+        total = _new_shard()
+        for path in glob.glob(os.path.join(self.shared_dir, "*.json")):
+            try:
+                with open(path) as f:
+                    state = json.load(f)
+            except (OSError, ValueError):
+                continue
+            self._merge(
+                total,
+                {
+                    "requests": {
+                        tuple(entry[:3]): entry[3] for entry in state["requests"]
+                    },
+                    "latency": state["latency"],
+                },
+            )
+        return total
+
+    def render(self):
+        """Return the metrics in the Prometheus text exposition format."""
+        if self.shared_dir is None:
+            total = self._totals()
+        else:
+            total = self._shared_totals()
+
+        lines = [
+            "# HELP http_requests_total Total HTTP requests.",
+            "# TYPE http_requests_total counter",
+        ]
+        for (route, method, status), count in sorted(total["requests"].items()):
+            lines.append(
+                f'http_requests_total{{route="{_escape(route)}",'
+                f'method="{_escape(method)}",status="{status}"}} {count}'
+            )
+
+        lines += [
+            "# HELP http_request_duration_seconds HTTP request latency.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        bounds = [f"{bound:g}" for bound in self.buckets] + ["+Inf"]
+        for route, histogram in sorted(total["latency"].items()):
+            label = f'route="{_escape(route)}"'
+            cumulative = 0
+            for bound, count in zip(bounds, histogram):
+                cumulative += count
+                lines.append(
+                    f'http_request_duration_seconds_bucket{{{label},le="{bound}"}} '
+                    f"{cumulative}"
+                )
+            lines += [
+                f"http_request_duration_seconds_sum{{{label}}} {histogram[-1]}",
+                f"http_request_duration_seconds_count{{{label}}} {cumulative}",
+            ]
+
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,113 @@
+"""
+Production server entry point for the deployment application.
+
+Runs the app under gunicorn where it is installed (preforking workers with
+threads), otherwise under waitress, and only as a last resort under
+Werkzeug's threaded server. Workers, threads, keep-alive and graceful
+shutdown come from the active Config class.
+"""
+
+import logging
+import os
+import shutil
+import tempfile
+
+logger = logging.getLogger(__name__)
+
+try:
+    from gunicorn.app.base import BaseApplication
+except ImportError:  # gunicorn is POSIX-only
+    BaseApplication = None
+
+try:
+    import waitress
+except ImportError:
+    waitress = None
+
+
+if BaseApplication is not None:
+
+    class _GunicornApplication(BaseApplication):
+        """Run an already-loaded WSGI app under gunicorn."""
+
+        def __init__(self, application, options):
+            self.application = application
+            self.options = options
+            super().__init__()
+
+        def load_config(self):
+            for key, value in self.options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            return self.application
+
+
+def _split_bind(bind):
+    """Split a host:port bind address, including bracketed IPv6 hosts."""
+    host, _, port = bind.rpartition(":")
+    return host.strip("[]") or "0.0.0.0", int(port)
+
+
+def serve(application, settings, health_monitor=None, metrics=None):
+    """Serve application with the server settings from a Flask config.
+
+    If health_monitor is given it is started here. Under gunicorn it runs in
+    the master only and shares its results with the workers through a
+    file, so the dependencies are probed once rather than once per worker.
+    Likewise, the workers share their request metrics through files, so
+    every scrape of /metrics sees the totals of all workers.
+    """
+    bind = settings["BIND"]
+    workers = settings["WORKERS"]
+    threads = settings["THREADS"]
+
+    if BaseApplication is not None:
+        options = {
+            "bind": bind,
+            "workers": workers,
+            "threads": threads,
+            "worker_class": "gthread" if threads > 1 else "sync",
+            "keepalive": settings["KEEP_ALIVE"],
+            "graceful_timeout": settings["GRACEFUL_TIMEOUT"],
+            "timeout": settings["WORKER_TIMEOUT"],
+        }
+        state_dir = tempfile.mkdtemp(prefix="app-")
+        options["on_exit"] = lambda server: shutil.rmtree(state_dir, ignore_errors=True)
+        if health_monitor is not None:
+            health_monitor.state_path = os.path.join(state_dir, "health.json")
+            options["when_ready"] = lambda server: health_monitor.start()
+        if metrics is not None:
+            metrics.shared_dir = os.path.join(state_dir, "metrics")
+            os.mkdir(metrics.shared_dir)
+        _GunicornApplication(application, options).run()
+        return
+
+    # The remaining servers run in a single process.
+    if health_monitor is not None:
+        health_monitor.start()
+    if waitress is not None:
+        # waitress has no worker processes, so their threads are pooled.
+        waitress.serve(
+            application,
+            listen=bind,
+            threads=workers * threads,
+            channel_timeout=settings["KEEP_ALIVE"],
+        )
+    else:
+        from werkzeug.serving import run_simple
+
+        logger.warning(
+            "Neither gunicorn nor waitress is installed; "
+            "falling back to the threaded Werkzeug server"
+        )
+        host, port = _split_bind(bind)
+        run_simple(host, port, application, threaded=True)
+
+
+if __name__ == "__main__":
+    os.environ.setdefault("FLASK_ENV", "production")
+
+    from app import app, health_monitor, request_metrics
+
+    serve(app, app.config, health_monitor, request_metrics)
@@ -0,0 +1,110 @@
+"""
+Tests for the deployment application's endpoints.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from app import app, database, health_monitor
+from flask import jsonify
+from sqlalchemy.exc import OperationalError
+
+
+@pytest.fixture
+def client():
+    return app.test_client()
+
+
+@pytest.mark.parametrize(
+    "path, payload",
+    [
+        (
+            "/",
+            {
+                "status": "ok",
+                "environment": "testing",
+                "debug": True,
+                "version": "1.0.0",
+            },
+        ),
+        ("/health", {"status": "healthy", "environment": "testing"}),
+        (
+            "/config",
+            {
+                "env": "testing",
+                "debug": True,
+                "version": "1.0.0",
+                "database": "sqlite:///:memory:@******",
+            },
+        ),
+    ],
+)
+def test_static_endpoints_match_jsonify(client, path, payload):
+    """Test that prebuilt bodies are byte-for-byte what jsonify produced."""
+    response = client.get(path)
+
+    assert response.status_code == 200
+    assert response.mimetype == "application/json"
+    with app.app_context():
+        assert response.get_data() == jsonify(payload).get_data()
+
+
+@pytest.mark.parametrize("path", ["/", "/health", "/config"])
+def test_static_endpoints_etag(client, path):
+    """Test that a matching If-None-Match gets an empty 304."""
+    etag = client.get(path).headers["ETag"]
+    assert etag
+
+    response = client.get(path, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.get_data() == b""
+    assert response.headers["ETag"] == etag
+
+    response = client.get(path, headers={"If-None-Match": f'"stale", W/{etag}'})
+    assert response.status_code == 304
+
+    response = client.get(path, headers={"If-None-Match": '"stale"'})
+    assert response.status_code == 200
+    assert response.get_data()
+
+
+def test_ready_serves_cached_probes(client):
+    """Test that /ready reports the monitor's last results."""
+    try:
+        health_monitor.refresh()
+        response = client.get("/ready")
+    finally:
+        health_monitor.stop()
+
+    assert response.status_code == 200
+    assert response.get_json()["checks"]["database"]["status"] == "ok"
+
+
+def test_metrics_endpoint(client):
+    """Test that requests are counted and exposed in Prometheus format."""
+    client.get("/health")
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.mimetype == "text/plain"
+    text = response.get_data(as_text=True)
+    assert 'http_requests_total{route="/health",method="GET",status="200"}' in text
+    assert 'http_request_duration_seconds_count{route="/health"}' in text
+
+
+def test_db_endpoint(client):
+    """Test that /db runs a query through the pool."""
+    response = client.get("/db")
+
+    assert response.status_code == 200
+    assert response.get_json()["result"] == 1
+
+
+def test_db_endpoint_database_error(client):
+    """Test that a failing database gives 503 without leaking details."""
+    error = OperationalError("SELECT 1", {}, Exception("secret"))
+    with patch.object(database, "ping", side_effect=error):
+        response = client.get("/db")
+
+    assert response.status_code == 503
+    assert response.get_json() == {"status": "error", "error": "OperationalError"}
@@ -0,0 +1,71 @@
+"""
+Tests for the pooled database layer.
+"""
+
+from unittest.mock import patch
+
+import db
+from config import TestingConfig
+from db import Database
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import QueuePool, SingletonThreadPool
+
+
+def test_file_database_is_pooled(tmp_path):
+    """Test that file databases get a QueuePool of the configured size."""
+    database = Database(f"sqlite:///{tmp_path / 'app.db'}", pool_size=2, max_overflow=1)
+    assert database.ping() == 1
+
+    pool = database.engine.pool
+    assert isinstance(pool, QueuePool)
+    assert pool.size() == 2
+    assert pool._max_overflow == 1
+    with database.connect():
+        assert database.pool_status()["checkedout"] == 1
+    assert database.pool_status()["checkedout"] == 0
+    database.dispose()
+
+
+def test_in_memory_database_is_not_sized():
+    """Test that in-memory SQLite ignores the pool size settings."""
+    database = Database("sqlite:///:memory:", pool_size=2, max_overflow=1)
+    assert database.ping() == 1
+    assert isinstance(database.engine.pool, SingletonThreadPool)
+    assert database.pool_status() == {"class": "SingletonThreadPool"}
+
+
+def test_engine_is_created_lazily(tmp_path):
+    """Test that the engine is built on first use and then reused."""
+    database = Database(f"sqlite:///{tmp_path / 'app.db'}")
+    assert database._engine is None
+    engine = database.engine
+    assert database.engine is engine
+
+
+def test_engine_drops_inherited_connections_after_fork(tmp_path):
+    """Test that a forked worker does not reuse its parent's connections."""
+    database = Database(f"sqlite:///{tmp_path / 'app.db'}")
+    engine = database.engine
+    database.ping()
+
+    with patch.object(engine, "dispose", wraps=engine.dispose) as dispose:
+        with patch.object(db.os, "getpid", return_value=database._pid + 1):
+            assert database.engine is engine
+            assert database.engine is engine
+        dispose.assert_called_once_with(close=False)
+    assert database.ping() == 1
+
+
+def test_from_config():
+    """Test that Database.from_config reads the DATABASE_* settings."""
+    settings = {
+        name: getattr(TestingConfig, name)
+        for name in dir(TestingConfig)
+        if name.isupper()
+    }
+    database = Database.from_config(dict(settings, DATABASE_POOL_SIZE=3))
+
+    assert database.url == TestingConfig.DATABASE_URL
+    assert database.pool_size == 3
+    assert database.max_overflow == TestingConfig.DATABASE_MAX_OVERFLOW
+    assert database.pool_pre_ping is TestingConfig.DATABASE_POOL_PRE_PING
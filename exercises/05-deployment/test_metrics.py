@@ -0,0 +1,138 @@
+"""
+Tests for the request metrics.
+"""
+
+import gc
+import os
+import threading
+import weakref
+
+import pytest
+from metrics import RequestMetrics
+
+
+def sample(text, name):
+    """Return the value of the sample called name in rendered metrics."""
+    for line in text.splitlines():
+        if line.startswith(name + " "):
+            return float(line.rsplit(" ", 1)[1])
+    raise KeyError(name)
+
+
+def requests_total(text, route, method="GET", status=200):
+    """Return the request count for one route, method and status."""
+    labels = f'route="{route}",method="{method}",status="{status}"'
+    return sample(text, f"http_requests_total{{{labels}}}")
+
+
+def test_counts_by_route_method_and_status():
+    metrics = RequestMetrics()
+    metrics.observe("/a", "GET", 200, 0.01)
+    metrics.observe("/a", "GET", 200, 0.01)
+    metrics.observe("/a", "POST", 500, 0.01)
+    text = metrics.render()
+
+    assert requests_total(text, "/a") == 2
+    assert requests_total(text, "/a", "POST", 500) == 1
+
+
+def test_histogram_bucket_edges():
+    """Test that buckets are cumulative and include their upper bound."""
+    metrics = RequestMetrics(buckets=(0.1, 1.0))
+    for seconds in (0.05, 0.1, 0.5, 1.0, 3.0):
+        metrics.observe("/a", "GET", 200, seconds)
+    text = metrics.render()
+
+    bucket = 'http_request_duration_seconds_bucket{route="/a",le="%s"}'
+    assert sample(text, bucket % "0.1") == 2
+    assert sample(text, bucket % "1") == 4
+    assert sample(text, bucket % "+Inf") == 5
+    assert sample(text, 'http_request_duration_seconds_count{route="/a"}') == 5
+    total = sample(text, 'http_request_duration_seconds_sum{route="/a"}')
+    assert total == pytest.approx(4.65)
+
+
+def test_label_values_are_escaped():
+    metrics = RequestMetrics()
+    metrics.observe('/a"b\\c', "GET", 200, 0.01)
+
+    assert 'route="/a\\"b\\\\c"' in metrics.render()
+
+
+def test_threads_record_into_separate_shards():
+    """Test that counts from many threads add up once merged."""
+    metrics = RequestMetrics()
+
+    def work():
+        for _ in range(100):
+            metrics.observe("/a", "GET", 200, 0.01)
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    text = metrics.render()
+    assert requests_total(text, "/a") == 800
+
+
+def test_finished_threads_are_retired():
+    """Test that thread-per-request servers do not pile up shards."""
+    metrics = RequestMetrics()
+    for _ in range(200):
+        thread = threading.Thread(target=metrics.observe, args=("/a", "GET", 200, 0.01))
+        thread.start()
+        thread.join()
+
+    assert len(metrics._shards) <= 65
+    text = metrics.render()
+    assert not metrics._shards
+    assert requests_total(text, "/a") == 200
+
+
+def test_instances_can_be_collected():
+    """Test that the fork hook does not keep metrics objects alive."""
+    metrics = RequestMetrics()
+    metrics.observe("/a", "GET", 200, 0.01)
+    ref = weakref.ref(metrics)
+    del metrics
+    gc.collect()
+    assert ref() is None
+
+
+def test_shared_dir_sums_every_process(tmp_path):
+    """Test that published totals from other processes are included."""
+    other = RequestMetrics(shared_dir=str(tmp_path))
+    other.observe("/a", "GET", 200, 0.01)
+    other.publish()
+    # Give the file a name of its own, as another process's pid would.
+    os.replace(tmp_path / f"{os.getpid()}.json", tmp_path / "other.json")
+
+    metrics = RequestMetrics(shared_dir=str(tmp_path), publish_interval=3600)
+    metrics.observe("/a", "GET", 200, 0.01)
+    metrics.observe("/b", "GET", 404, 0.01)
+    text = metrics.render()
+
+    assert requests_total(text, "/a") == 2
+    assert requests_total(text, "/b", "GET", 404) == 1
+    assert sample(text, 'http_request_duration_seconds_count{route="/a"}') == 2
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_forked_child_counts_from_zero(tmp_path):
+    """Test that a forked worker publishes only its own requests."""
+    metrics = RequestMetrics(shared_dir=str(tmp_path), publish_interval=3600)
+    metrics.observe("/a", "GET", 200, 0.01)
+
+    pid = os.fork()
+    if pid == 0:
+        try:
+            metrics.observe("/a", "GET", 200, 0.01)
+            metrics.publish()
+        finally:
+            os._exit(0)
+    os.waitpid(pid, 0)
+
+    text = metrics.render()
+    assert requests_total(text, "/a") == 2
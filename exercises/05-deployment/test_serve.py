@@ -0,0 +1,124 @@
+"""
+Tests for the production server entry point.
+"""
+
+import os
+import runpy
+from unittest.mock import MagicMock, patch
+
+import pytest
+import serve
+
+SETTINGS = {
+    "BIND": "127.0.0.1:8000",
+    "WORKERS": 3,
+    "THREADS": 4,
+    "KEEP_ALIVE": 5,
+    "GRACEFUL_TIMEOUT": 60,
+    "WORKER_TIMEOUT": 30,
+}
+
+
+@pytest.mark.parametrize(
+    "bind, expected",
+    [
+        ("127.0.0.1:8000", ("127.0.0.1", 8000)),
+        (":5000", ("0.0.0.0", 5000)),
+        ("[::1]:8080", ("::1", 8080)),
+    ],
+)
+def test_split_bind(bind, expected):
+    assert serve._split_bind(bind) == expected
+
+
+@pytest.fixture
+def gunicorn(monkeypatch):
+    """Pretend gunicorn is installed and capture the application it runs."""
+    application = MagicMock()
+    monkeypatch.setattr(serve, "BaseApplication", object)
+    monkeypatch.setattr(serve, "_GunicornApplication", application, raising=False)
+    return application
+
+
+@pytest.mark.parametrize("threads, worker_class", [(4, "gthread"), (1, "sync")])
+def test_serve_gunicorn_options(gunicorn, threads, worker_class):
+    app = object()
+    serve.serve(app, dict(SETTINGS, THREADS=threads))
+
+    (application, options), _ = gunicorn.call_args
+    assert application is app
+    assert options["bind"] == "127.0.0.1:8000"
+    assert options["workers"] == 3
+    assert options["threads"] == threads
+    assert options["worker_class"] == worker_class
+    assert options["keepalive"] == 5
+    assert options["graceful_timeout"] == 60
+    assert options["timeout"] == 30
+    gunicorn.return_value.run.assert_called_once_with()
+    options["on_exit"](None)
+
+
+def test_serve_gunicorn_shares_state_from_master(gunicorn):
+    """Test that probing starts in the master and state lives in one dir."""
+    monitor = MagicMock(state_path=None)
+    metrics = MagicMock(shared_dir=None)
+    serve.serve(object(), SETTINGS, monitor, metrics)
+
+    (_, options), _ = gunicorn.call_args
+    monitor.start.assert_not_called()
+    options["when_ready"](None)
+    monitor.start.assert_called_once_with()
+
+    state_dir = os.path.dirname(monitor.state_path)
+    assert os.path.dirname(metrics.shared_dir) == state_dir
+    assert os.path.isdir(metrics.shared_dir)
+    options["on_exit"](None)
+    assert not os.path.exists(state_dir)
+
+
+def test_serve_waitress(monkeypatch):
+    waitress = MagicMock()
+    monkeypatch.setattr(serve, "BaseApplication", None)
+    monkeypatch.setattr(serve, "waitress", waitress)
+    monitor = MagicMock()
+    app = object()
+    serve.serve(app, SETTINGS, monitor)
+
+    monitor.start.assert_called_once_with()
+    waitress.serve.assert_called_once_with(
+        app, listen="127.0.0.1:8000", threads=12, channel_timeout=5
+    )
+
+
+def test_serve_werkzeug_fallback(monkeypatch, caplog):
+    monkeypatch.setattr(serve, "BaseApplication", None)
+    monkeypatch.setattr(serve, "waitress", None)
+    app = object()
+    with patch("werkzeug.serving.run_simple") as run_simple:
+        serve.serve(app, SETTINGS)
+
+    run_simple.assert_called_once_with("127.0.0.1", 8000, app, threaded=True)
+    assert "falling back" in caplog.text
+
+
+@pytest.mark.parametrize("env, debug", [("testing", True), ("staging", False)])
+def test_app_main(monkeypatch, env, debug):
+    """Test that python app.py uses the dev server only in debug mode."""
+    monkeypatch.setenv("FLASK_ENV", env)
+    monkeypatch.setenv("PORT", "5050")
+    with patch("flask.Flask.run") as run, patch("serve.serve") as production:
+        module = runpy.run_path(
+            os.path.join(os.path.dirname(__file__), "app.py"), run_name="__main__"
+        )
+
+    if debug:
+        run.assert_called_once_with(host="0.0.0.0", port=5050)
+        production.assert_not_called()
+    else:
+        run.assert_not_called()
+        production.assert_called_once_with(
+            module["app"],
+            module["app"].config,
+            module["health_monitor"],
+            module["request_metrics"],
+        )
@@ -1,3 +1,9 @@
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is optional
+    np = None
+
+
 def add(a: float, b: float) -> float:
     """Add two numbers."""
     return a + b
@@ -18,3 +24,117 @@ def divide(a: float, b: float) -> float:
     if b == 0:
         raise ValueError("Cannot divide by zero")
     return a / b
+
+
+class BatchDivisionError(ValueError):
+    """Raised by divide_batch when one or more divisors are zero."""
+
+    # At most this many indices are listed in the message; all of them are
+    # kept in .indices.
+    max_listed = 10
+
+    def __init__(self, indices):
+        self.indices = list(indices)
+        listed = ", ".join(map(str, self.indices[: self.max_listed]))
+        hidden = len(self.indices) - self.max_listed
+        if hidden > 0:
+            listed += f", ... ({hidden} more)"
+        super().__init__(f"Cannot divide by zero at indices [{listed}]")
+
+
+# The batch variants evaluate whole columns in one call. Inputs may be NumPy
+# arrays, array.array objects, other buffer-protocol objects or sequences, and
+# a scalar operand is broadcast against the other one. Without NumPy a
+# plain-Python fallback with the same semantics returns lists.
+
+
+def _as_array(values):
+    """Return values as an array of their own dtype, without copying."""
+    return np.asarray(values)
+
+
+def _result_bounds(operation, a_range, b_range):
+    """Return the smallest and largest result of operation over two ranges."""
+    (a_low, a_high), (b_low, b_high) = a_range, b_range
+    if operation is np.add:
+        return a_low + b_low, a_high + b_high
+    if operation is np.subtract:
+        return a_low - b_high, a_high - b_low
+    products = [x * y for x in (a_low, a_high) for y in (b_low, b_high)]
+    return min(products), max(products)
+
+
+def _integer_operands(operation, a, b):
+    """Return a and b as arrays that operation can combine exactly.
+
+    Integer columns keep their dtype unless the result could fall outside
+    it, in which case they are promoted to Python ints so the result stays
+    exact, as with the scalar functions, instead of silently wrapping.
+    """
+    a, b = _as_array(a), _as_array(b)
+    dtype = np.result_type(a, b)
+    if dtype.kind not in "iu" or a.size == 0 or b.size == 0:
+        return a, b
+    low, high = _result_bounds(
+        operation,
+        (int(a.min()), int(a.max())),
+        (int(b.min()), int(b.max())),
+    )
+    info = np.iinfo(dtype)
+    if low < info.min or high > info.max:
+        return a.astype(object), b.astype(object)
+    return a, b
+
+
+def _pairs(a, b):
+    """Return broadcast (a, b) pairs for the plain-Python fallback."""
+    a_scalar, b_scalar = isinstance(a, (int, float)), isinstance(b, (int, float))
+    if a_scalar and b_scalar:
+        return [(a, b)]
+    if a_scalar:
+        return [(a, y) for y in b]
+    if b_scalar:
+        return [(x, b) for x in a]
+    if len(a) != len(b):
+        raise ValueError(f"Length mismatch: {len(a)} != {len(b)}")
+    return list(zip(a, b))
+
+
+def add_batch(a, b):
+    """Add two columns element-wise."""
+    if np is not None:
+        return np.add(*_integer_operands(np.add, a, b))
+    return [x + y for x, y in _pairs(a, b)]
+
+
+def subtract_batch(a, b):
+    """Subtract column b from column a element-wise."""
+    if np is not None:
+        return np.subtract(*_integer_operands(np.subtract, a, b))
+    return [x - y for x, y in _pairs(a, b)]
+
+
+def multiply_batch(a, b):
+    """Multiply two columns element-wise."""
+    if np is not None:
+        return np.multiply(*_integer_operands(np.multiply, a, b))
+    return [x * y for x, y in _pairs(a, b)]
+
+
+def divide_batch(a, b):
+    """Divide column a by column b element-wise.
+
+    All zero divisors are found up front and reported together through
+    BatchDivisionError.indices rather than failing on the first one.
+    """
+    if np is not None:
+        a, b = _as_array(a), _as_array(b)
+        zero = np.broadcast_to(b == 0, np.broadcast(a, b).shape)
+        if zero.any():
+            raise BatchDivisionError(np.flatnonzero(zero).tolist())
+        return np.divide(a, b)
+    pairs = _pairs(a, b)
+    zero = [i for i, (_, y) in enumerate(pairs) if y == 0]
+    if zero:
+        raise BatchDivisionError(zero)
+    return [x / y for x, y in pairs]
@@ -1,6 +1,19 @@
+from array import array
+
 import pytest
 
-from src.calculator import add, divide, multiply, subtract
+import src.calculator
+from src.calculator import (
+    BatchDivisionError,
+    add,
+    add_batch,
+    divide,
+    divide_batch,
+    multiply,
+    multiply_batch,
+    subtract,
+    subtract_batch,
+)
 
 
 def test_add():
@@ -30,3 +43,75 @@ def test_divide():
 def test_divide_by_zero():
     with pytest.raises(ValueError):
         divide(5, 0)
+
+
+def test_add_batch():
+    assert list(add_batch([1, 2, 3], [4, 5, 6])) == [5, 7, 9]
+    assert list(add_batch(array("d", [1.0, 2.0]), 1)) == [2, 3]
+
+
+def test_subtract_batch():
+    assert list(subtract_batch([5, 3], [3, 5])) == [2, -2]
+    assert list(subtract_batch(10, [1, 2])) == [9, 8]
+
+
+def test_multiply_batch():
+    assert list(multiply_batch(array("d", [2.0, -2.0]), [3, 3])) == [6, -6]
+    assert list(multiply_batch(memoryview(array("d", [1.5, 2.0])), 2)) == [3, 4]
+
+
+def test_divide_batch():
+    assert list(divide_batch([6, 5, 0], [2, 2, 5])) == [3, 2.5, 0]
+    assert list(divide_batch([6, 4], 2)) == [3, 2]
+
+
+def test_divide_batch_reports_all_zero_divisors():
+    with pytest.raises(BatchDivisionError) as excinfo:
+        divide_batch([1, 2, 3, 4], [1, 0, 2, 0])
+    assert excinfo.value.indices == [1, 3]
+    assert isinstance(excinfo.value, ValueError)
+
+
+def test_batch_length_mismatch():
+    with pytest.raises(ValueError):
+        add_batch([1, 2, 3], [1, 2])
+
+
+def test_batch_preserves_integer_precision():
+    big = 2**53 + 1
+    assert add_batch([big], [0])[0] == big
+
+
+def test_batch_does_not_wrap_integer_overflow():
+    assert list(add_batch([2**62], [2**62])) == [add(2**62, 2**62)]
+    assert list(subtract_batch([-(2**62)], 2**62)) == [-(2**63)]
+    assert list(multiply_batch([2**40, 3], [2**40, 3])) == [2**80, 9]
+
+
+def test_batch_does_not_wrap_numpy_integer_dtypes():
+    np = pytest.importorskip("numpy")
+    unsigned = np.array([1, 2], dtype=np.uint8)
+    assert list(subtract_batch(unsigned, np.array([2, 1], dtype=np.uint8))) == [-1, 1]
+    # Results that fit keep the input dtype.
+    assert add_batch(np.array([1, 2]), 3).dtype == np.int64
+
+
+def test_batch_division_error_message_is_capped():
+    with pytest.raises(BatchDivisionError) as excinfo:
+        divide_batch([1] * 1000, 0)
+    assert len(excinfo.value.indices) == 1000
+    assert "(990 more)" in str(excinfo.value)
+    assert len(str(excinfo.value)) < 100
+
+
+def test_batch_fallback_without_numpy(monkeypatch):
+    monkeypatch.setattr(src.calculator, "np", None)
+    assert add_batch([1, 2], [3, 4]) == [4, 6]
+    assert subtract_batch(10, [1, 2]) == [9, 8]
+    assert multiply_batch(array("d", [2.0, -2.0]), 3) == [6, -6]
+    assert divide_batch([6, 5], [2, 2]) == [3, 2.5]
+    with pytest.raises(BatchDivisionError) as excinfo:
+        divide_batch([1, 2, 3], [1, 0, 0])
+    assert excinfo.value.indices == [1, 2]
+    with pytest.raises(ValueError):
+        add_batch([1, 2, 3], [1, 2])